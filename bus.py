@@ -0,0 +1,103 @@
+from machine import Pin, I2C
+from ina219 import INA219
+import time
+
+
+
+class Channel:
+    ''' One INA219 of the bus with its sample buffer and counters.
+    '''
+    def __init__(self, ina219):
+        self.ina219 = ina219
+        self.address = ina219.address
+        
+        # Sample buffer attached by the sampler, a SampleRing or a Handoff.
+        self.buffer = None
+        
+        # Number of samples taken.
+        self.samples = 0
+        # Polls without a new conversion.
+        self.stale = 0
+        # Samples with a current or power math overflow.
+        self.overflows = 0
+        # Failed I2C transactions.
+        self.errors = 0
+    
+    
+    def poll(self, timestamp):
+        ''' Pushes a sample into the buffer if the INA219 has finished a new conversion.
+        '''
+        ina219 = self.ina219
+        
+        try:
+            if not ina219.poll():
+                self.stale += 1
+                return
+        except OSError:
+            self.errors += 1
+            return
+        
+        self.samples += 1
+        self.overflows += ina219.overflow
+        self.buffer.add(timestamp, ina219.current, ina219.power, ina219.bus_voltage)
+    
+    
+    def take(self):
+        ''' Returns the samples taken since the last call as frame data.
+        '''
+        return self.buffer.take()
+    
+    
+    def reset_counters(self):
+        self.samples = 0
+        self.stale = 0
+        self.overflows = 0
+        self.errors = 0
+
+
+
+class INA219Bus:
+    ''' All INA219 sensors found on one shared I2C bus.
+    '''
+    # Address range selectable by the INA219 A0 and A1 pins.
+    MIN_ADDRESS = 0x40
+    MAX_ADDRESS = 0x4F
+    
+    
+    def __init__(self, profile='balanced', calibration=None, i2c=None):
+        self.i2c = i2c if i2c else I2C(1, scl=Pin(27), sda=Pin(26), freq=400000)
+        
+        self.channels = [Channel(INA219(profile, calibration, self.i2c, address))
+                         for address in self.i2c.scan() if self.MIN_ADDRESS <= address <= self.MAX_ADDRESS]
+        
+        if not self.channels:
+            raise OSError('no INA219 found')
+        
+        # Slowest conversion period of all sensors.
+        self.conversion_period_us = max(channel.ina219.conversion_period_us for channel in self.channels)
+        
+        self.start = time.ticks_us()
+    
+    
+    def poll(self):
+        ''' Polls all channels once with a common timestamp.
+        '''
+        timestamp = time.ticks_us()
+        
+        for channel in self.channels:
+            channel.poll(timestamp)
+    
+    
+    def throughput(self):
+        ''' Returns the samples per second of each channel since the counters were reset.
+        '''
+        elapsed = time.ticks_diff(time.ticks_us(), self.start)
+        
+        return [channel.samples * 1000000 / elapsed if elapsed > 0 else 0 for channel in self.channels]
+    
+    
+    def reset_counters(self):
+        self.start = time.ticks_us()
+        
+        for channel in self.channels:
+            channel.reset_counters()
@@ -0,0 +1,83 @@
+class Calibration:
+    ''' Derives the INA219 calibration from the shunt resistance and the expected maximum current.
+    
+        All values are integers: currents in uA, power in uW and the register LSBs in nA and nW.
+    '''
+    # Full scale shunt voltages in uV of the PGA gains and their configuration register bits.
+    GAINS = (
+        (40000, 0x0000),
+        (80000, 0x0800),
+        (160000, 0x1000),
+        (320000, 0x1800),
+    )
+    
+    # Largest positive value of the current register.
+    MAX_RAW_CURRENT = 32767
+    
+    # Largest calibration register value, bit 0 is not used.
+    MAX_VALUE = 0xFFFE
+    
+    # Fixed scaling constant of the calibration equation, 0.04096 in nA * uOhm.
+    SCALE = 40960000000000
+    
+    
+    def __init__(self, shunt_mohm=100, max_current_ma=3200, current_lsb_na=None):
+        self.shunt_uohm = int(shunt_mohm * 1000)
+        self.max_current_ua = int(max_current_ma * 1000)
+        
+        if self.shunt_uohm <= 0 or self.max_current_ua <= 0:
+            raise ValueError('shunt resistance and maximum current must be positive')
+        
+        # Smallest PGA range covering the maximum shunt voltage.
+        shunt_voltage_uv = self.max_current_ua * self.shunt_uohm // 1000000
+        for self.shunt_range_uv, self.gain in self.GAINS:
+            if shunt_voltage_uv <= self.shunt_range_uv:
+                break
+        else:
+            raise ValueError('maximum shunt voltage of %d uV exceeds the INA219 range' % shunt_voltage_uv)
+        
+        # Smallest current LSB that still covers the maximum current, rounded up to full nA,
+        # or a given one, e.g. a round 100 uA.
+        self.current_lsb_na = -(-self.max_current_ua * 1000 // self.MAX_RAW_CURRENT)
+        
+        if current_lsb_na is not None:
+            if current_lsb_na < self.current_lsb_na:
+                raise ValueError('current LSB of %d nA does not cover the maximum current' % current_lsb_na)
+            
+            self.current_lsb_na = current_lsb_na
+        
+        # Coarser LSB if the calibration value would not fit into its register.
+        min_lsb_na = -(-self.SCALE // (self.MAX_VALUE * self.shunt_uohm))
+        self.current_lsb_na = self.current_lsb_na if self.current_lsb_na > min_lsb_na else min_lsb_na
+        
+        self.power_lsb_nw = 20 * self.current_lsb_na
+        self.value = self.SCALE // (self.current_lsb_na * self.shunt_uohm) & self.MAX_VALUE
+        
+        # LSBs split into whole uA/uW and the remaining nA/nW. This keeps the products in
+        # the conversions below small integers, which do not allocate on MicroPython.
+        self._current_lsb_ua, self._current_lsb_frac = divmod(self.current_lsb_na, 1000)
+        self._power_lsb_uw, self._power_lsb_frac = divmod(self.power_lsb_nw, 1000)
+    
+    
+    def register_bytes(self):
+        ''' Returns the calibration register value as bytes to write.
+        '''
+        return bytes((self.value >> 8, self.value & 0xFF))
+    
+    
+    def current_ua(self, raw):
+        ''' Converts a raw current register value to uA.
+        '''
+        # Two's complement register.
+        raw = raw - 0x10000 if raw & 0x8000 else raw
+        
+        if raw < 0:
+            return -(-raw * self._current_lsb_ua + -raw * self._current_lsb_frac // 1000)
+        
+        return raw * self._current_lsb_ua + raw * self._current_lsb_frac // 1000
+    
+    
+    def power_uw(self, raw):
+        ''' Converts a raw power register value to uW.
+        '''
+        return raw * self._power_lsb_uw + raw * self._power_lsb_frac // 1000
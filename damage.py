@@ -0,0 +1,110 @@
+import time
+
+
+
+class Damage:
+    ''' Regions of the display buffer changed since the last flush, sent as few windows.
+        
+        Widgets report a value per region, and only regions whose value changed are
+        redrawn and marked damaged. Overlapping or touching regions are merged into
+        one window. The buffer is shared by the four screen quadrants, so every pane
+        flushes its damage before the next pane draws, band by band if the buffer
+        only holds some lines of a quadrant.
+    '''
+    def __init__(self, lcd):
+        self.lcd = lcd
+        
+        # Damaged regions as x0, y0, x1, y1 with exclusive end.
+        self.rects = []
+        # Last value drawn per region key.
+        self.values = {}
+        
+        self.start_frame()
+    
+    
+    def start_frame(self):
+        ''' Resets the per frame counters.
+        '''
+        # Pixel bytes sent and time spent sending in us.
+        self.bytes = 0
+        self.flush_us = 0
+    
+    
+    def invalidate(self):
+        ''' Forgets all drawn values, so every region is redrawn.
+        '''
+        self.values = {}
+    
+    
+    def changed(self, key, value, x, y, width, height):
+        ''' Returns whether the value of a region changed since it was drawn, and marks
+            the region damaged if so.
+        '''
+        if key in self.values and self.values[key] == value:
+            return False
+        
+        self.values[key] = value
+        self.add(x, y, width, height)
+        
+        return True
+    
+    
+    def add(self, x, y, width, height):
+        ''' Marks a region damaged, merged with all regions it overlaps or touches.
+        '''
+        x0 = x if x > 0 else 0
+        y0 = y if y > 0 else 0
+        x1 = min(x + width, self.lcd.WIDTH)
+        y1 = min(y + height, self.lcd.HEIGHT)
+        
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        i = 0
+        while i < len(self.rects):
+            rx0, ry0, rx1, ry1 = self.rects[i]
+            
+            if x0 <= rx1 and rx0 <= x1 and y0 <= ry1 and ry0 <= y1:
+                x0 = min(x0, rx0)
+                y0 = min(y0, ry0)
+                x1 = max(x1, rx1)
+                y1 = max(y1, ry1)
+                
+                # The grown region may now touch regions checked before.
+                del self.rects[i]
+                i = 0
+                continue
+            
+            i += 1
+        
+        self.rects.append((x0, y0, x1, y1))
+    
+    
+    def send(self, buffer, x, y, width, height, screen_x, screen_y, stride):
+        ''' Sends a region of any buffer and counts it.
+        '''
+        start = time.ticks_us()
+        self.lcd.blit_region(buffer, x, y, width, height, screen_x, screen_y, stride)
+        
+        self.flush_us += time.ticks_diff(time.ticks_us(), start)
+        self.bytes += width * height * 2
+    
+    
+    def flush(self, screen_x, screen_y, band_y=0):
+        ''' Sends the damaged regions within the band of the display buffer starting at
+            quadrant row band_y to the quadrant at screen_x, screen_y.
+        '''
+        lines = self.lcd.lines
+        
+        for x0, y0, x1, y1 in self.rects:
+            y0 = y0 if y0 > band_y else band_y
+            y1 = y1 if y1 < band_y + lines else band_y + lines
+            
+            if y0 < y1:
+                self.send(self.lcd.buffer, x0, y0 - band_y, x1 - x0, y1 - y0, screen_x + x0, screen_y + y0, self.lcd.WIDTH)
+    
+    
+    def clear(self):
+        ''' Forgets the damaged regions after all bands are sent.
+        '''
+        self.rects = []
@@ -0,0 +1,102 @@
+from ringbuffer import RingBuffer
+
+
+
+def _mean(a, b):
+    return (a + b) // 2
+
+
+
+class Envelope:
+    ''' Whole session history at a fixed number of columns, with minimum, maximum
+        and mean current in uA per column.
+    
+        Values are added incrementally. When all columns are used, neighbouring columns
+        are merged in place and every column covers twice the time. Minimum and maximum
+        survive every merge, so no peak gets lost, and memory and drawing cost are
+        bounded by the column count instead of the session length.
+    '''
+    def __init__(self, columns, period):
+        # Columns must be even to merge them pairwise.
+        self.columns = columns - columns % 2
+        self.base_period = period
+        
+        self.minimum = RingBuffer(self.columns)
+        self.maximum = RingBuffer(self.columns)
+        self.mean = RingBuffer(self.columns)
+        self.reset()
+    
+    
+    def reset(self):
+        ''' Clears all columns.
+        '''
+        self.minimum.clear()
+        self.maximum.clear()
+        self.mean.clear()
+        
+        # Values per column and column length in s.
+        self.span = 1
+        self.period = self.base_period
+        
+        # Largest maximum of the session.
+        self.highest = 0
+        self.reset_pending()
+    
+    
+    def reset_pending(self):
+        ''' Clears the column being filled.
+        '''
+        self.parts = 0
+        self.low = 0
+        self.high = 0
+        self.sum = 0
+    
+    
+    def add(self, minimum, maximum, mean):
+        ''' Adds a value covering the base period.
+        '''
+        if not self.parts:
+            self.low = minimum
+            self.high = maximum
+        else:
+            self.low = minimum if minimum < self.low else self.low
+            self.high = maximum if maximum > self.high else self.high
+        
+        self.sum += mean
+        self.parts += 1
+        
+        if self.parts < self.span:
+            return
+        
+        self.minimum.append(self.low)
+        self.maximum.append(self.high)
+        self.mean.append(self.sum // self.parts)
+        self.highest = self.high if self.high > self.highest else self.highest
+        self.reset_pending()
+        
+        if len(self.mean) == self.columns:
+            self._merge()
+    
+    
+    def _merge(self):
+        ''' Merges neighbouring columns in place and halves the number of used columns.
+        '''
+        # Full buffers are merged right away, so they never overwrite a column.
+        self.minimum.merge_pairs(min)
+        self.maximum.merge_pairs(max)
+        self.mean.merge_pairs(_mean)
+        
+        self.span *= 2
+        self.period *= 2
+    
+    
+    def peak(self):
+        ''' Returns the largest maximum of the session.
+        '''
+        return self.highest
+    
+    
+    def start_time(self):
+        ''' Returns the session time in s of the first column, always the session start.
+        '''
+        return 0
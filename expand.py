@@ -0,0 +1,40 @@
+import micropython
+
+
+
+# Palette indexed pixels are expanded one row at a time into RGB565 for the display.
+# Both kernels take the source buffer, an RGB565 target with one entry per pixel,
+# the palette of RGB565 colors and the span of pixels as start * SPAN + count, so
+# the viper versions stay within four arguments. Rows start at an even pixel for
+# GS4_HMSB and at a multiple of four for GS2_HMSB, as the pixel position within
+# the byte is taken from the buffer offset.
+SPAN = micropython.const(1024)
+
+
+def expand_gs4(source, target, palette, span):
+    ''' Expands GS4_HMSB pixels, the even pixel in the high nibble.
+    '''
+    pixel = span >> 10
+    
+    for i in range(span & 0x3FF):
+        value = source[pixel >> 1]
+        target[i] = palette[value & 0xF if pixel & 0x1 else value >> 4]
+        pixel += 1
+
+
+def expand_gs2(source, target, palette, span):
+    ''' Expands GS2_HMSB pixels, the first pixel in the low bits.
+    '''
+    pixel = span >> 10
+    
+    for i in range(span & 0x3FF):
+        target[i] = palette[(source[pixel >> 2] >> ((pixel & 0x3) << 1)) & 0x3]
+        pixel += 1
+
+
+# Viper kernels where the port compiles them, the compiler rejects the decorator
+# otherwise, and on the host the stand-in micropython module has no viper.
+try:
+    from expand_viper import expand_gs2, expand_gs4
+except (SyntaxError, AttributeError):
+    pass
@@ -0,0 +1,27 @@
+import micropython
+
+
+
+# Viper versions of the kernels in expand.py, native code working on raw pointers.
+
+
+@micropython.viper
+def expand_gs4(source: ptr8, target: ptr16, palette: ptr16, span: int):
+    pixel = span >> 10
+    
+    for i in range(span & 0x3FF):
+        value = source[pixel >> 1]
+        if pixel & 0x1:
+            target[i] = palette[value & 0xF]
+        else:
+            target[i] = palette[value >> 4]
+        pixel += 1
+
+
+@micropython.viper
+def expand_gs2(source: ptr8, target: ptr16, palette: ptr16, span: int):
+    pixel = span >> 10
+    
+    for i in range(span & 0x3FF):
+        target[i] = palette[(source[pixel >> 2] >> ((pixel & 0x3) << 1)) & 0x3]
+        pixel += 1
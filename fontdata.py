@@ -0,0 +1,146 @@
+# Generated by host/fontc.py from font.py, do not edit.
+
+# Characters in the order of the glyphs.
+CHARACTERS = '.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz='
+
+# Pixels between two glyphs, advance of a space and height of a text line.
+LETTER_SPACING = 4
+SPACE_ADVANCE = 5
+LINE_HEIGHT = 27
+
+# Per glyph: pixel width, height, y offset to the text line, advance to the next
+# glyph and offset of the MONO_HLSB rows in GLYPH_DATA, high byte first.
+METRIC_SIZE = 6
+GLYPH_METRICS = (
+    b'\x03\x03\x17\x06\x00\x00'  # .
+    b'\x0e\x13\x07\x11\x00\x03'  # 0
+    b'\x07\x13\x07\x0a\x00\x29'  # 1
+    b'\x0c\x13\x07\x0f\x00\x3c'  # 2
+    b'\x0d\x13\x07\x10\x00\x62'  # 3
+    b'\x0e\x13\x07\x11\x00\x88'  # 4
+    b'\x0d\x13\x07\x10\x00\xae'  # 5
+    b'\x0d\x14\x06\x10\x00\xd4'  # 6
+    b'\x0d\x13\x07\x10\x00\xfc'  # 7
+    b'\x0d\x13\x07\x10\x01\x22'  # 8
+    b'\x0d\x13\x07\x10\x01\x48'  # 9
+    b'\x13\x13\x07\x16\x01\x6e'  # A
+    b'\x0c\x13\x07\x0f\x01\xa7'  # B
+    b'\x11\x13\x07\x14\x01\xcd'  # C
+    b'\x10\x13\x07\x13\x02\x06'  # D
+    b'\x0b\x13\x07\x0e\x02\x2c'  # E
+    b'\x0b\x13\x07\x0e\x02\x52'  # F
+    b'\x13\x13\x07\x16\x02\x78'  # G
+    b'\x10\x13\x07\x13\x02\xb1'  # H
+    b'\x03\x13\x07\x06\x02\xd7'  # I
+    b'\x09\x13\x07\x0c\x02\xea'  # J
+    b'\x0f\x13\x07\x12\x03\x10'  # K
+    b'\x0a\x13\x07\x0d\x03\x36'  # L
+    b'\x17\x13\x07\x1a\x03\x5c'  # M
+    b'\x11\x13\x07\x14\x03\x95'  # N
+    b'\x15\x13\x07\x18\x03\xce'  # O
+    b'\x0c\x13\x07\x0f\x04\x07'  # P
+    b'\x16\x14\x06\x19\x04\x2d'  # Q
+    b'\x0d\x13\x07\x10\x04\x69'  # R
+    b'\x0d\x13\x07\x10\x04\x8f'  # S
+    b'\x0d\x13\x07\x10\x04\xb5'  # T
+    b'\x10\x13\x07\x13\x04\xdb'  # U
+    b'\x11\x13\x07\x14\x05\x01'  # V
+    b'\x19\x13\x07\x1c\x05\x3a'  # W
+    b'\x0f\x13\x07\x12\x05\x86'  # X
+    b'\x11\x13\x07\x14\x05\xac'  # Y
+    b'\x0f\x13\x07\x12\x05\xe5'  # Z
+    b'\x0d\x0d\x0d\x10\x06\x0b'  # a
+    b'\x0d\x14\x06\x10\x06\x25'  # b
+    b'\x0a\x0d\x0d\x0d\x06\x4d'  # c
+    b'\x0d\x14\x06\x10\x06\x67'  # d
+    b'\x0d\x0d\x0d\x10\x06\x8f'  # e
+    b'\x08\x14\x06\x0b\x06\xa9'  # f
+    b'\x0d\x13\x07\x10\x06\xbd'  # g
+    b'\x0c\x14\x06\x0f\x06\xe3'  # h
+    b'\x04\x15\x05\x07\x07\x0b'  # i
+    b'\x04\x1b\x00\x07\x07\x20'  # j
+    b'\x0c\x14\x06\x0f\x07\x3b'  # k
+    b'\x03\x14\x06\x06\x07\x63'  # l
+    b'\x13\x0d\x0d\x16\x07\x77'  # m
+    b'\x0c\x0d\x0d\x0f\x07\x9e'  # n
+    b'\x0e\x0d\x0d\x11\x07\xb8'  # o
+    b'\x0d\x13\x07\x10\x07\xd2'  # p
+    b'\x0d\x13\x07\x10\x07\xf8'  # q
+    b'\x08\x0d\x0d\x0b\x08\x1e'  # r
+    b'\x0a\x0d\x0d\x0d\x08\x2b'  # s
+    b'\x07\x12\x08\x0a\x08\x45'  # t
+    b'\x0c\x0d\x0d\x0f\x08\x57'  # u
+    b'\x0d\x0d\x0d\x10\x08\x71'  # v
+    b'\x14\x0d\x0d\x17\x08\x8b'  # w
+    b'\x0d\x0d\x0d\x10\x08\xb2'  # x
+    b'\x0d\x13\x07\x10\x08\xcc'  # y
+    b'\x0c\x0d\x0d\x0f\x08\xf2'  # z
+    b'\x10\x0b\x0f\x13\x09\x0c'  # =
+)
+
+GLYPH_DATA = (
+    b'\xe0\xe0\xe0'  # .
+    b'\x0f\xc0\x1f\xe0\x38\x70\x70\x38\x70\x38\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\x70\x38\x70\x38\x38\x70\x1f\xe0\x0f\xc0'  # 0
+    b'\x7e\xfe\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e'  # 1
+    b'\x1f\x80\x3f\xe0\x70\xe0\xf0\x70\xe0\x70\xe0\x70\x00\x70\x00\x70\x00\xe0\x00\xe0\x01\xc0\x03\x80\x07\x80\x0f\x00\x1e\x00\x1c\x00\x38\x00\x7f\xf0\xff\xf0'  # 2
+    b'\x0f\xc0\x3f\xf0\x78\x70\x70\x38\x70\x38\x00\x38\x00\x38\x00\x70\x03\xe0\x03\xe0\x00\x70\x00\x38\x00\x38\xe0\x38\xe0\x38\x70\x38\x78\x70\x3f\xe0\x0f\xc0'  # 3
+    b'\x00\x10\x00\x30\x00\x70\x00\x70\x00\xf0\x01\xf0\x01\xf0\x03\xf0\x07\x70\x06\x70\x0e\x70\x1c\x70\x38\x70\x38\x70\x7f\xfc\xff\xfc\x00\x70\x00\x70\x00\x70'  # 4
+    b'\x1f\xf0\x1f\xf0\x18\x00\x38\x00\x38\x00\x30\x00\x3f\xc0\x3f\xe0\x60\xf0\x40\x78\x00\x38\x00\x38\x00\x38\x00\x38\x40\x38\x60\x70\xf0\xf0\x7f\xe0\x1f\x80'  # 5
+    b'\x01\x80\x01\xc0\x03\x80\x07\x00\x0e\x00\x0c\x00\x1c\x00\x3f\xc0\x3f\xe0\x78\xf0\x70\x70\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x70\x78\xf0\x3f\xe0\x0f\x80'  # 6
+    b'\xff\xf8\xff\xf0\x00\xf0\x00\xe0\x00\xe0\x01\xc0\x01\xc0\x03\x80\x03\x80\x07\x00\x07\x00\x0e\x00\x0e\x00\x1c\x00\x1c\x00\x38\x00\x38\x00\x30\x00\x70\x00'  # 7
+    b'\x0f\x80\x1f\xc0\x38\xe0\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x38\xe0\x1f\xc0\x3f\xe0\x70\x70\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x70\x7f\xf0\x1f\xc0'  # 8
+    b'\x0f\x80\x3f\xe0\x78\xf0\x70\x70\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x70\x78\xf0\x3f\xe0\x1f\xe0\x01\xc0\x01\x80\x03\x80\x07\x00\x0e\x00\x1c\x00'  # 9
+    b'\x00\x40\x00\x00\x40\x00\x00\xe0\x00\x00\xe0\x00\x01\xf0\x00\x01\xf0\x00\x03\xb8\x00\x03\x38\x00\x07\x1c\x00\x06\x1c\x00\x0e\x0e\x00\x0f\xfe\x00\x1f\xff\x00\x1f\xff\x00\x38\x03\x80\x38\x03\x80\x70\x03\xc0\x70\x01\xc0\xe0\x01\xe0'  # A
+    b'\xff\x00\xff\xc0\xff\xc0\xe1\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe1\xe0\xff\xc0\xff\xc0\xff\xe0\xe0\xf0\xe0\x70\xe0\x70\xe0\x70\xe0\xf0\xff\xe0\xff\xe0\xff\x80'  # B
+    b'\x01\xfc\x00\x07\xff\x00\x1f\xff\x80\x3e\x03\x80\x78\x00\x80\x70\x00\x00\xf0\x00\x00\xe0\x00\x00\xe0\x00\x00\xe0\x00\x00\xe0\x00\x00\xe0\x00\x00\xf0\x00\x00\x70\x00\x00\x78\x00\x80\x3e\x03\x80\x1f\xff\x80\x07\xff\x00\x01\xfc\x00'  # C
+    b'\xff\xc0\xff\xf0\xff\xf8\xe0\x3c\xe0\x1e\xe0\x0e\xe0\x0f\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x0f\xe0\x0e\xe0\x1e\xe0\x3c\xff\xf8\xff\xf0\xff\xc0'  # D
+    b'\xff\xe0\xff\xe0\xff\xe0\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xff\xe0\xff\xe0\xff\xe0\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xff\xe0\xff\xe0\xff\xe0'  # E
+    b'\xff\xe0\xff\xe0\xff\xe0\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xff\xe0\xff\xe0\xff\xe0\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00'  # F
+    b'\x01\xfc\x00\x0f\xff\x00\x1f\xff\x80\x3e\x03\x00\x78\x00\x00\x70\x00\x00\xf0\x00\x00\xe0\x00\x00\xe0\x00\x00\xe0\x1f\xe0\xe0\x1f\xe0\xe0\x1f\xe0\xf0\x00\xe0\x70\x00\xe0\x78\x01\xc0\x3e\x07\xc0\x1f\xff\x80\x0f\xff\x00\x01\xfc\x00'  # G
+    b'\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xff\xff\xff\xff\xff\xff\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07'  # H
+    b'\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0'  # I
+    b'\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x03\x80\x23\x80\xff\x80\x7f\x00\x3e\x00'  # J
+    b'\xe0\x3c\xe0\x78\xe0\xf0\xe1\xe0\xe3\xc0\xe7\x80\xef\x00\xfe\x00\xfc\x00\xfe\x00\xef\x00\xe7\x80\xe3\xc0\xe3\xc0\xe1\xe0\xe0\xf0\xe0\x78\xe0\x3c\xe0\x3e'  # K
+    b'\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xff\xc0\xff\xc0\xff\xc0'  # L
+    b'\x08\x00\x40\x08\x00\x20\x0c\x00\x60\x0c\x00\x60\x0e\x00\xe0\x1e\x00\xf0\x1f\x01\xf0\x1f\x01\xf0\x1b\x83\xb0\x3b\x83\xb8\x39\xc7\x38\x39\xc7\x38\x30\xee\x38\x70\xee\x1c\x70\x7c\x1c\x70\x38\x1c\x70\x38\x1c\xe0\x10\x0e\xe0\x10\x0e'  # M
+    b'\x80\x03\x80\xc0\x03\x80\xe0\x03\x80\xf0\x03\x80\xf8\x03\x80\xfc\x03\x80\xee\x03\x80\xef\x03\x80\xe7\x83\x80\xe1\xc3\x80\xe0\xf3\x80\xe0\x7b\x80\xe0\x3b\x80\xe0\x1f\x80\xe0\x0f\x80\xe0\x07\x80\xe0\x03\x80\xe0\x01\x80\xe0\x00\x80'  # N
+    b'\x01\xfc\x00\x07\xff\x00\x1f\xff\xc0\x3f\x07\xe0\x3c\x01\xe0\x78\x00\xf0\x70\x00\x70\xe0\x00\x38\xe0\x00\x38\xe0\x00\x38\xe0\x00\x38\xe0\x00\x38\x70\x00\x70\x78\x00\xf0\x3c\x01\xe0\x3f\x07\xe0\x1f\xff\xc0\x07\xff\x00\x01\xfc\x00'  # O
+    b'\xff\x80\xff\xe0\xff\xe0\xe0\xf0\xe0\x70\xe0\x70\xe0\x70\xe0\xf0\xff\xe0\xff\xe0\xff\x80\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00'  # P
+    b'\x01\xfc\x00\x07\xff\x00\x1f\xff\xc0\x3f\x07\xe0\x3c\x01\xf0\x78\x00\xf0\x70\x00\x78\xe0\x00\x38\xe0\x00\x38\xe0\x00\x38\xe0\x00\x38\xe0\x00\x38\x70\x3e\x70\x78\x0f\xf0\x3c\x07\xe0\x3f\x07\xe0\x1f\xff\xe0\x07\xff\xf0\x01\xfc\x78\x00\x00\x3c'  # Q
+    b'\xff\x00\xff\xc0\xff\xc0\xe1\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe1\xe0\xff\xc0\xff\xc0\xff\x00\xee\x00\xe7\x00\xe3\x80\xe3\xc0\xe1\xc0\xe1\xe0\xe0\xf0\xe0\x78'  # R
+    b'\x0f\xc0\x3f\xe0\x3f\xf0\x78\x70\x70\x00\x70\x00\x78\x00\x3f\x00\x1f\xc0\x07\xe0\x00\xf0\x00\x78\x00\x38\x20\x38\xe0\x38\x78\x78\x7f\xf0\x3f\xe0\x0f\x80'  # S
+    b'\xff\xf8\xff\xf8\xff\xf8\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00\x07\x00'  # T
+    b'\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xe0\x07\xf0\x0f\x78\x1e\x7f\xfe\x3f\xfc\x0f\xf0'  # U
+    b'\xe0\x03\x80\x70\x07\x00\x70\x07\x00\x38\x0e\x00\x38\x0e\x00\x38\x1e\x00\x1c\x1c\x00\x1c\x1c\x00\x0e\x38\x00\x0e\x38\x00\x07\x70\x00\x07\x70\x00\x03\x60\x00\x03\xe0\x00\x03\xc0\x00\x01\xc0\x00\x01\xc0\x00\x00\x80\x00\x00\x80\x00'  # V
+    b'\xe0\x08\x03\x80\x70\x08\x07\x00\x70\x18\x07\x00\x70\x1c\x07\x00\x38\x1c\x0e\x00\x38\x3e\x0e\x00\x38\x3e\x0c\x00\x1c\x77\x1c\x00\x1c\x77\x1c\x00\x0e\x63\x38\x00\x0e\xe3\xb8\x00\x0e\xc3\xb8\x00\x07\xc1\xf0\x00\x07\xc1\xf0\x00\x03\x80\xe0\x00\x03\x80\xe0\x00\x03\x00\x60\x00\x01\x00\x40\x00\x02\x00\x40\x00'  # W
+    b'\x78\x0e\x38\x1c\x3c\x38\x1c\x38\x0e\x70\x0e\x70\x07\xe0\x07\xc0\x03\xc0\x03\xc0\x07\xc0\x07\xe0\x0e\xe0\x0e\x70\x1c\x78\x3c\x38\x38\x3c\x70\x1c\xf0\x0e'  # X
+    b'\xf0\x07\x80\x78\x07\x00\x38\x0e\x00\x3c\x1e\x00\x1e\x1c\x00\x0e\x38\x00\x0f\x78\x00\x07\x70\x00\x03\xe0\x00\x03\xe0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00\x01\xc0\x00'  # Y
+    b'\x3f\xfe\x3f\xfc\x3f\xf8\x00\x38\x00\x70\x00\xe0\x00\xe0\x01\xc0\x01\xc0\x03\x80\x07\x00\x07\x00\x0e\x00\x1e\x00\x1c\x00\x38\x00\x3f\xfe\x7f\xfe\xff\xfe'  # Z
+    b'\x1f\x38\x3f\xf8\x78\xf8\x70\x78\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x78\x78\xf8\x3f\xf8\x1f\x38'  # a
+    b'\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe7\xc0\xff\xe0\xf8\xf0\xf0\x70\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xf0\x70\xf8\xf0\xff\xe0\xe7\xc0'  # b
+    b'\x0f\x80\x3f\xc0\x78\x40\x70\x40\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\x70\x40\x78\x40\x3f\xc0\x0f\x80'  # c
+    b'\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x1f\x38\x3f\xf8\x78\xf8\x70\x78\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x78\x78\xf8\x3f\xf8\x1f\x38'  # d
+    b'\x0f\x80\x3f\xe0\x78\x70\x70\x30\xe0\x38\xff\xf8\xff\xf8\xe0\x00\xe0\x20\x70\x78\x78\xf0\x3f\xe0\x0f\xc0'  # e
+    b'\x0f\x1f\x38\x38\x38\x38\x38\xff\xff\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38'  # f
+    b'\x1f\x38\x3f\xf8\x78\xf8\x70\x78\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x78\x78\xf8\x3f\xf8\x1f\x38\x00\x38\x70\x38\x70\x78\x78\x70\x3f\xe0\x0f\xc0'  # g
+    b'\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe7\xc0\xff\xe0\xf0\xf0\xf0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70'  # h
+    b'\x60\xf0\xf0\x60\x00\x00\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70'  # i
+    b'\x60\xf0\xf0\x60\x00\x00\x00\x00\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70\x70'  # j
+    b'\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\xe0\xe1\xc0\xe3\x80\xe7\x00\xee\x00\xfc\x00\xfe\x00\xee\x00\xe7\x00\xe3\x80\xe3\xc0\xe1\xe0\xe0\xf0'  # k
+    b'\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0'  # l
+    b'\xe7\x87\x80\xff\xdf\xc0\xf1\xf1\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0'  # m
+    b'\xe7\xc0\xff\xe0\xf0\xf0\xf0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70'  # n
+    b'\x0f\xc0\x3f\xe0\x78\x78\x70\x38\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\xe0\x1c\x70\x38\x78\x78\x1f\xe0\x0f\xc0'  # o
+    b'\xe7\xc0\xff\xe0\xf8\xf0\xf0\x70\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xf0\x70\xf8\xf0\xff\xe0\xe7\xc0\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00\xe0\x00'  # p
+    b'\x1f\x38\x3f\xf8\x78\xf8\x70\x78\xe0\x38\xe0\x38\xe0\x38\xe0\x38\xe0\x38\x70\x78\x78\xf8\x3f\xf8\x1f\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38\x00\x38'  # q
+    b'\xef\xfe\xf2\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0'  # r
+    b'\x3f\x00\x7f\x80\xe1\x00\xe0\x00\xf0\x00\x7e\x00\x3f\x80\x07\xc0\x01\xc0\x41\xc0\xe3\xc0\x7f\x80\x3f\x00'  # s
+    b'\x38\x38\x38\x38\x38\xfe\xfe\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38\x38'  # t
+    b'\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\xe0\x70\x70\xe0\x7f\xe0\x1f\x80'  # u
+    b'\xe0\x38\x70\x70\x70\x70\x30\xe0\x38\xe0\x18\xc0\x1d\xc0\x0d\x80\x0f\x80\x07\x00\x07\x00\x02\x00\x02\x00'  # v
+    b'\xe0\x40\x70\x60\x60\xe0\x70\x60\xe0\x30\xf0\xc0\x38\xf1\xc0\x19\xf9\x80\x1d\x9b\x80\x0f\x9b\x00\x0f\x0f\x00\x0f\x0e\x00\x06\x0e\x00\x06\x04\x00\x04\x04\x00'  # w
+    b'\xf0\xf0\x70\xe0\x39\xc0\x3f\xc0\x1f\x80\x0f\x00\x0f\x00\x1f\x80\x1f\xc0\x39\xc0\x30\xe0\x70\xf0\xe0\x78'  # x
+    b'\xe0\x38\x70\x70\x70\x70\x70\xe0\x38\xe0\x38\xc0\x19\xc0\x1d\x80\x1f\x80\x0f\x80\x0f\x00\x0f\x00\x0e\x00\x0e\x00\x1c\x00\x1c\x00\x38\x00\x38\x00\x70\x00'  # y
+    b'\x7f\xf0\x7f\xe0\x01\xc0\x03\xc0\x03\x80\x07\x00\x0f\x00\x0e\x00\x1e\x00\x3c\x00\x38\x00\x7f\xf0\xff\xf0'  # z
+    b'\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\xff\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00'  # =
+)
@@ -0,0 +1,61 @@
+from fontdata import GLYPH_DATA, GLYPH_METRICS, METRIC_SIZE, LINE_HEIGHT
+import framebuf
+
+
+
+class Glyphs:
+    ''' Glyphs of the compiled font as MONO_HLSB frame buffers.
+        
+        The font rows are packed most significant bit first, which is the MONO_HLSB
+        layout. Frame buffers need writable memory, so the glyph data is copied into
+        RAM once, every glyph being a view into that copy. A glyph is drawn with one
+        blit, its set bits expanded to the text color by a palette and its clear bits
+        skipped by the key color.
+    '''
+    def __init__(self):
+        self.data = bytearray(GLYPH_DATA)
+        data = memoryview(self.data)
+        
+        # Frame buffer, pixel width, y offset to the text line and advance per glyph.
+        self.buffers = []
+        self.widths = []
+        self.y_offsets = []
+        self.advances = []
+        
+        # Height of a text line including all glyphs.
+        self.height = LINE_HEIGHT
+        
+        for i in range(0, len(GLYPH_METRICS), METRIC_SIZE):
+            width = GLYPH_METRICS[i]
+            height = GLYPH_METRICS[i + 1]
+            offset = (GLYPH_METRICS[i + 4] << 8) | GLYPH_METRICS[i + 5]
+            size = (width + 7) // 8 * height
+            
+            self.buffers.append(framebuf.FrameBuffer(data[offset:offset + size], width, height, framebuf.MONO_HLSB))
+            self.widths.append(width)
+            self.y_offsets.append(GLYPH_METRICS[i + 2])
+            self.advances.append(GLYPH_METRICS[i + 3])
+        
+        # Key color at index 0 and text color at index 1.
+        self.palette = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+        self.color = None
+    
+    
+    def set_color(self, color):
+        ''' Sets the text color, the key color only has to differ from it.
+        '''
+        if color == self.color:
+            return
+        
+        self.palette.pixel(0, 0, color ^ 0x1)
+        self.palette.pixel(1, 0, color)
+        self.color = color
+    
+    
+    def draw(self, buffer, index, x, y, color):
+        ''' Draws the glyph into the frame buffer and returns its advance in pixel.
+        '''
+        self.set_color(color)
+        buffer.blit(self.buffers[index], x, y + self.y_offsets[index], color ^ 0x1, self.palette)
+        
+        return self.advances[index]
@@ -1,12 +1,20 @@
 from ili9488 import ILI9488
-from font import *
+from integrator import Accumulator
+from stats import Statistics
+from history import History
+from glyphs import Glyphs
+from textcache import TextCache
+from layout import Layout
+from damage import Damage
+import framebuf
+import time
 
 
 
 
 
 class GUI:
-    # Maximum number of measured values in the graph lists.
+    # Number of values in the graph, buckets per history tier.
     MAX_VALUE_NUMBER = 200
     
     # Graph height in pixel.
@@ -18,151 +26,211 @@ class GUI:
     # Zero-point offset of x axis. 
     X_OFFSET = 40
     
+    # Light red of the minimum to maximum span behind the graph line, byte order as in ILI9488.
+    ENVELOPE_COLOR = 0x10FC
     
+    # Graph background color.
+    GRAPH_COLOR = 0xFDDE
     
-    def __init__(self, frames_sec):
+    # Most new values drawn incrementally, more redraw the whole graph.
+    MAX_STRIP_VALUES = 8
+    
+    # Byte budget of the rendered string cache.
+    TEXT_CACHE_BYTES = 4096
+    
+    # Colors of each pane, at most four to fit the palette of a GS2_HMSB display buffer.
+    NUMERIC_COLORS = (ILI9488.BLACK, ILI9488.WHITE)
+    BUTTON_COLORS = (ILI9488.BLACK, ILI9488.WHITE, ILI9488.RED, ILI9488.GREEN)
+    GRAPH_COLORS = (GRAPH_COLOR, ILI9488.BLACK, ILI9488.RED, ENVELOPE_COLOR)
+    
+    
+    
+    def __init__(self, lines=ILI9488.HEIGHT, format=framebuf.RGB565):
         self.height = ILI9488.HEIGHT - (ILI9488.HEIGHT - self.Y_OFFSET) - 1
         
-        self.current_values = []
+        self.current = 0
         self.power = 0
         self.voltage = 0
-        self.work = 0
-        self.current_max = 0
-        self.time_offset = 0
-        self.frames_sec = 1 / frames_sec
+        self.work = Accumulator()
+        self.charge = Accumulator()
         self.process_active = False
         
-        self.lcd = ILI9488()
+        # Tick count in ms of the last frame and session time in ms up to it. Tick
+        # differences wrap after 2^29 ms on the device, so the session time is their sum.
+        self.tick = 0
+        self.elapsed_ms = 0
+        
+        # Session statistics of all samples.
+        self.current_stats = Statistics()
+        self.power_stats = Statistics()
+        self.voltage_stats = Statistics()
+        
+        # Current history of the session and the tier shown in the graph.
+        self.history = History(self.MAX_VALUE_NUMBER)
+        self.graph = self.history.select()
+        
+        # Graph state on the display, to draw only new values while scale and window are unchanged.
+        self.plot_graph = None
+        self.plot_scale = 0
+        self.plot_start = 0
+        self.plot_period = 0
+        self.plot_count = 0
+        
+        # Static graph background of the lower screen half, one bit per pixel, drawn once
+        # and expanded to background and grid color by the palette on every restore.
+        self.background = framebuf.FrameBuffer(bytearray(ILI9488.WIDTH * 2 * ILI9488.HEIGHT // 8), ILI9488.WIDTH * 2, ILI9488.HEIGHT, framebuf.MONO_HLSB)
+        self.draw_graph_background(self.background, 1)
+        
+        # Font glyphs as frame buffers, drawn with one blit each, and their layout.
+        self.glyphs = Glyphs()
+        self.layout = Layout()
+        
+        # Rendered strings, most labels and units are drawn every frame.
+        self.text_cache = TextCache(self.glyphs, self.layout, self.TEXT_CACHE_BYTES)
+        
+        # Display buffer of a whole quadrant, or of a band of lines to save RAM, holding
+        # RGB565 colors or palette indices of the pane colors.
+        self.lcd = ILI9488(lines, format)
+        self.use_colors(self.GRAPH_COLORS)
+        
+        self.palette = framebuf.FrameBuffer(bytearray(4), 2, 1, framebuf.RGB565)
+        self.palette.pixel(0, 0, self.ink[self.GRAPH_COLOR])
+        self.palette.pixel(1, 0, self.ink[ILI9488.BLACK])
+        
+        # First quadrant row of the band being drawn.
+        self.band_y = 0
+        
+        # Changed display regions, only those are sent.
+        self.damage = Damage(self.lcd)
     
 
-    def draw_point(self, x, y, color):
-        ''' Draws one pixel at given position.
-        '''
-        self.lcd.hline(x, y, 1, color)
-    
-    
-    def get_letter_index(self, letter):
-        ''' Returns the data table index of given letter.
-        '''   
-        if letter.isdigit():
-            return ord(letter) - ord('0') + 1
-        elif letter.isupper():
-            return ord(letter) - ord('A') + 11
-        elif letter.islower():
-            return ord(letter) - ord('a') + 37
-        elif letter == '.':
-            return 0
-        elif letter == '=':
-            return 63
-    
-    
-    def draw_letter(self, letter, x, y, color):
-        ''' Draws the letter and returns its width in pixel.
+    def use_colors(self, colors):
+        ''' Selects the colors of the pane drawn next, ink maps each of them to the value
+            drawn into the display buffer, the color itself or its palette index.
         '''
-        index = self.get_letter_index(letter)
-        
-        # Get the letter byte width, height and table offset.
-        width = int(FONT_META[index][0] / 8) + (1 if FONT_META[index][0] % 8 else 0)
-        offset = FONT_META[index][1]
-        height = int((FONT_META[index + 1][1] - FONT_META[index][1]) / width)
-        
-        # Correction of y to set same text line.
-        y = y + (MAX_FONT_HEIGHT - height) if MAX_FONT_HEIGHT > height else height
-        
-        # Bit width as return value for spaces when string is drawn.
-        bit_width = 0
-        
-        # Draw the letter.
-        for i in range(width * height):
-            for j in range(8):
-                if(FONT_DATA[offset + i] >> j) & 0x1:
-                    self.draw_point(x + (7 - j) + (i % width) * 8, y + int(i / width), color)
-                    bit_width = 7 - j if 7 - j > bit_width and i % width == width - 1 else bit_width
-                            
-        # Return bit width.
-        bit_width += (width - 1) * 8
-
-        return bit_width
+        if self.lcd.format == framebuf.RGB565:
+            self.ink = {color: color for color in colors}
+        else:
+            self.ink = {color: i for i, color in enumerate(colors)}
+            self.lcd.set_palette(colors)
     
     
     def draw_string(self, string, x, y, color):
-        offset = 0
-        for letter in string:
-            if letter == ' ':
-                offset += 5
-                continue
-            
-            offset += self.draw_letter(letter, x + offset, y, color) + 4
+        self.text_cache.draw(self.lcd, string, x, y, color)
     
     
     def get_string_width(self, string):
-        ''' Returns the width of string in pixels.
+        ''' Returns the width of string in pixels, measured as it is drawn.
         '''
-        width = 0
-        
-        for letter in string:
-            width += FONT_META[self.get_letter_index(letter)][0] + 4
-            
-        return width - 4
+        return self.layout.measure(string)
     
     
     def draw_string_right_adjusted(self, string, x, y, color):
         ''' Draws a string right aligned at position.
         '''
-        offset = 0
         width = self.get_string_width(string)
-        for letter in string:
-            offset += self.draw_letter(letter, x + offset - width, y, color) + 4
+        self.text_cache.draw(self.lcd, string, x - width, y, color)
+    
+    
+    def scale_value(self, value, unit, format='%1.1f'):
+        ''' Scales a value in micro units for display and returns its string and unit.
+        '''
+        if value < 1000000:
+            return format %(value / 1000), 'm' + unit
+        
+        return format %(value / 1000000), unit
+    
+    
+    def get_time_string(self, index):
+        ''' Returns the session time of a graph value index as axis label.
+        '''
+        minutes = int((self.graph.start_time() + index * self.graph.period) / 60)
+        
+        return str(minutes) + ' min' if minutes < 600 else str(int(minutes / 60)) + ' h'
     
     
     def set_bus_voltage(self, value):
-        ''' Updates the voltage currently applied at load.
+        ''' Updates the voltage in uV currently applied at load.
         '''
         self.voltage = value if self.process_active else 0
     
     
     def update_power(self, value):
-        ''' Updates the power currently needed by load.
+        ''' Updates the power in uW currently needed by load.
         '''
         self.power = value if self.process_active else 0
     
     
     def update_work(self, value):
-        ''' Adds the measured bus power for the last time slot to the work value. 
+        ''' Adds the work accumulator in uJ of the last time slot to the work value. 
         '''
         if not self.process_active:
             return
         
-        self.work = self.work + value / self.frames_sec
+        self.work.add(value)
     
     
-    def add_current_value(self, value):
-        ''' Adds the current value to list.
+    def update_charge(self, value):
+        ''' Adds the charge accumulator in uC of the last time slot to the charge value. 
+        '''
+        if not self.process_active:
+            return
+        
+        self.charge.add(value)
+    
+    
+    def add_current_value(self, value, minimum, maximum):
+        ''' Adds the mean, minimum and maximum current in uA of the last time slot to the history.
         '''
         
         if not self.process_active:
             return
         
-        # If maximum of current values is reached.
-        if len(self.current_values) >= self.MAX_VALUE_NUMBER:
-            # Shift current values.
-            self.current_values.pop(0)
-            # Increment time offset
-            self.time_offset += 1 / self.frames_sec
+        self.current = value
+        
+        tick = time.ticks_ms()
+        self.elapsed_ms += time.ticks_diff(tick, self.tick)
+        self.tick = tick
         
-        self.current_values.append(value)
+        self.history.add(self.elapsed_ms, minimum, maximum, value)
+    
+    
+    def add_frame(self, frame):
+        ''' Adds the aggregate record of all samples taken during the last time slot.
+        '''
+        if not frame.count:
+            return
+        
+        self.add_current_value(frame.mean_current(), frame.current_stats.min, frame.current_stats.max)
+        self.update_power(frame.mean_power())
+        self.update_work(frame.energy)
+        self.update_charge(frame.charge)
+        self.update_statistics(frame.current_stats, frame.power_stats, frame.voltage_stats)
+        self.set_bus_voltage(frame.voltage)
+    
+    
+    def update_statistics(self, current, power, voltage):
+        ''' Merges the current, power and voltage statistics of the last time slot into the session.
+        '''
+        if not self.process_active:
+            return
         
-        # Update maximum current.
-        self.current_max = value if value > self.current_max else self.current_max
+        self.current_stats.merge(current)
+        self.power_stats.merge(power)
+        self.voltage_stats.merge(voltage)
     
     
     def reset_data(self):
         ''' Resets process data if user stops. 
         '''
-        self.current_values.clear()
-        self.time_offset = 0
-        self.work = 0
-        self.current_max = 0
+        self.current = 0
+        self.elapsed_ms = 0
+        self.history.reset()
+        self.work.reset()
+        self.charge.reset()
+        self.current_stats.reset()
+        self.power_stats.reset()
+        self.voltage_stats.reset()
     
     
     def handle_touch(self):
@@ -185,6 +253,8 @@ class GUI:
             if 15 < y < 65:
                 if self.process_active:
                     self.reset_data()
+                else:
+                    self.tick = time.ticks_ms()
                 
                 self.process_active = not self.process_active
     
@@ -192,228 +262,301 @@ class GUI:
     def update(self):
         ''' Updates graph, numerical data views and buttons.
         '''
-        self.draw_graph_part_1()
-        self.draw_graph_part_2()
-        self.draw_numeric_values()
-        self.draw_buttons()
+        self.damage.start_frame()
         
+        # History tier that fits the graph width.
+        self.graph = self.history.select()
         
-    def draw_buttons(self):
-        self.lcd.fill(ILI9488.BLACK)
-        
-        # Top button.
-        color = ILI9488.RED if self.process_active else ILI9488.GREEN
-        for i in range(2):
-            self.lcd.hline(70, 15 + i, 100, color)
-            self.lcd.hline(70, 65 + i, 100, color)
-            self.lcd.vline(70 + i, 15, 50, color)
-            self.lcd.vline(170 + i, 15, 50, color)
-            
-        # Button text depends on process state.
-        if not self.process_active:
-            self.draw_string('START', 79, 24, color)
-        else:
-            self.draw_string('STOP', 85, 24, color)
+        self.draw_graph()
+        self.draw_numeric_values()
+        self.draw_buttons()
         
         
-        self.lcd.update_rectangle(ILI9488.RIGHT, ILI9488.TOP)
+    def bands(self):
+        ''' Yields the first pane row of every band the display buffer holds, a single
+            band if the buffer covers a whole quadrant.
+        '''
+        for y in range(0, ILI9488.HEIGHT, self.lcd.lines):
+            self.band_y = y
+            yield y
         
-
-    def draw_graph_part_1(self):
-        ''' Draws the left part of the graph.
+        self.damage.clear()
+    
+    
+    def in_band(self, y, height):
+        ''' Returns whether pane rows y to y + height intersect the current band.
         '''
-        self.lcd.fill(0xFDDE)
+        return y < self.band_y + self.lcd.lines and y + height > self.band_y
+    
+    
+    def draw_buttons(self):
+        ''' Draws the start and stop button and the session statistics, only the parts that changed.
+        '''
+        self.use_colors(self.BUTTON_COLORS)
+        ink = self.ink
+        
+        full = self.damage.changed('buttons', True, 0, 0, ILI9488.WIDTH, ILI9488.HEIGHT)
+        button = self.damage.changed('button', self.process_active, 70, 15, 102, 52)
+        color = ink[ILI9488.RED if self.process_active else ILI9488.GREEN]
+        
+        # Session statistics lines that changed.
+        lines = []
+        y_pos = 90
+        for name, stats, unit in (('I', self.current_stats, 'A'), ('P', self.power_stats, 'W')):
+            for label, value in (('avg', stats.mean), ('rms', stats.rms())):
+                string, scaled_unit = self.scale_value(int(value), unit)
+                string = '%s%s %s %s' %(name, label, string, scaled_unit)
+                
+                if self.damage.changed(name + label, string, 0, y_pos, ILI9488.WIDTH, 15):
+                    lines.append((y_pos, string))
+                
+                y_pos += 15
         
-        ## Draw graph frame.
-        length = ILI9488.WIDTH - self.X_OFFSET
+        for band_y in self.bands():
+            if full:
+                self.lcd.fill(ink[ILI9488.BLACK])
+            
+            # Top button.
+            if button and self.in_band(15, 52):
+                y = 15 - band_y
+                self.lcd.fill_rect(70, y, 102, 52, ink[ILI9488.BLACK])
+                
+                for i in range(2):
+                    self.lcd.hline(70, y + i, 100, color)
+                    self.lcd.hline(70, y + 50 + i, 100, color)
+                    self.lcd.vline(70 + i, y, 50, color)
+                    self.lcd.vline(170 + i, y, 50, color)
+                
+                # Button text depends on process state.
+                if not self.process_active:
+                    self.draw_string('START', 79, y + 9, color)
+                else:
+                    self.draw_string('STOP', 85, y + 9, color)
+            
+            for y_pos, string in lines:
+                if self.in_band(y_pos, 15):
+                    self.lcd.fill_rect(0, y_pos - band_y, ILI9488.WIDTH, 15, ink[ILI9488.BLACK])
+                    self.lcd.text(string, 70, y_pos - band_y, ink[ILI9488.WHITE])
+            
+            self.damage.flush(ILI9488.WIDTH, 0, band_y)
         
-        # Draw graph frame.
-        self.lcd.hline(self.X_OFFSET, self.Y_OFFSET, length, ILI9488.BLACK)
-        self.lcd.hline(self.X_OFFSET, self.Y_OFFSET + 1, length, ILI9488.BLACK)
-        self.lcd.vline(self.X_OFFSET, self.Y_OFFSET - self.height, self.height, ILI9488.BLACK)
-        self.lcd.vline(self.X_OFFSET - 1, self.Y_OFFSET - self.height, self.height, ILI9488.BLACK)
         
-        # X dotted lines.
-        for x in [1, 2, 3]:
-            for y in range(int(self.Y_OFFSET / 4) + 1):
-                self.lcd.vline(int(length / 4) * x + self.X_OFFSET, self.Y_OFFSET - y * 4, 2, ILI9488.BLACK)   
+    def draw_graph(self):
+        ''' Draws the graph, only the new values if neither the scale nor the window changed.
+        '''
+        self.use_colors(self.GRAPH_COLORS)
         
-        # Y coordinate lines.
-        self.lcd.hline(self.X_OFFSET - 6, 1, 12, ILI9488.BLACK)
-        self.lcd.hline(self.X_OFFSET - 6, 2, 12, ILI9488.BLACK)
+        graph = self.graph
+        count = len(graph.mean)
         
-        # Y dotted lines.
-        for y in [1, 2, 3]:
-            for x in range(int(length / 4) + 1):
-                self.lcd.vline(self.X_OFFSET + x * 4, self.Y_OFFSET - int(self.height / 4) * y, 2, ILI9488.BLACK)
-            
-        self.lcd.hline(self.X_OFFSET - 6, self.Y_OFFSET - int(self.height / 2), 12, ILI9488.BLACK)
-        self.lcd.hline(self.X_OFFSET - 6, self.Y_OFFSET - int(self.height / 2) - 1, 12, ILI9488.BLACK)
+        # Maximum current in full mA to scale the graph, in uA.
+        if self.process_active and count:
+            scale = (graph.peak() // 1000 + 1) * 1000
+        else:
+            scale = 1000
         
+        new = count - self.plot_count
         
-        # Draw time with unit, and x-coordinate lines.
-        self.lcd.vline(self.X_OFFSET + 120, self.Y_OFFSET - 5, 12, ILI9488.BLACK)
-        self.lcd.vline(self.X_OFFSET + 121, self.Y_OFFSET - 5, 12, ILI9488.BLACK)
-        string = str(int((self.frames_sec * 60 + self.time_offset) / 60)) + ' min'
-        self.lcd.text(string, self.X_OFFSET + 110, ILI9488.HEIGHT - 15, ILI9488.BLACK)
+        if (graph is self.plot_graph and scale == self.plot_scale and graph.start_time() == self.plot_start
+                and graph.period == self.plot_period and 0 <= new <= self.MAX_STRIP_VALUES):
+            if new:
+                self.draw_graph_strip(self.plot_count, count, scale)
+        else:
+            self.draw_graph_part(ILI9488.LEFT, scale)
+            self.draw_graph_part(ILI9488.RIGHT, scale)
         
+        self.plot_graph = graph
+        self.plot_scale = scale
+        self.plot_start = graph.start_time()
+        self.plot_period = graph.period
+        self.plot_count = count
     
-        # Get maximum current to scale graph. 
-        if self.process_active:
-            current_max = int(max(self.current_values) + 1)
-        else:
-            current_max = 1
     
-        # Draw current values and unit for axis.
-        self.lcd.text(str(current_max), 16, 3, ILI9488.BLACK)
-        self.lcd.text(str(current_max / 2), 7, int(self.height / 2) - 2, ILI9488.BLACK)
-        self.lcd.text('mA', 16, 12, ILI9488.BLACK)
+    def draw_graph_part(self, side, scale):
+        ''' Draws the left or right half of the graph in full.
+        '''
+        x = 0 if side == ILI9488.LEFT else ILI9488.WIDTH
+        black = self.ink[ILI9488.BLACK]
+        self.damage.add(0, 0, ILI9488.WIDTH, ILI9488.HEIGHT)
         
+        for band_y in self.bands():
+            # Restore the static background, which also clears the band.
+            self.lcd.blit(self.background, -x, -band_y, -1, self.palette)
             
-        # Leave if no measurements have been made already.
-        if not len(self.current_values):
-            self.lcd.update_rectangle(ILI9488.LEFT, ILI9488.BOTTOM)
-            return
+            # Current values and unit of the y axis.
+            if side == ILI9488.LEFT:
+                self.lcd.text(str(scale // 1000), 16, 3 - band_y, black)
+                self.lcd.text(str(scale / 2000), 7, int(self.height / 2) - 2 - band_y, black)
+                self.lcd.text('mA', 16, 12 - band_y, black)
+            
+            # Time of the x-coordinate lines.
+            if self.in_band(ILI9488.HEIGHT - 15, 8):
+                for i in range(3):
+                    self.lcd.text(self.get_time_string(60 * (i + 1)), self.X_OFFSET + 110 + i * 120 - x, ILI9488.HEIGHT - 15 - band_y, black)
+            
+            # Values are drawn from the top of the graph down to the x axis.
+            if self.in_band(self.Y_OFFSET - self.Y_HEIGHT, self.Y_HEIGHT + 1):
+                self.draw_trace(self.lcd, x, x + ILI9488.WIDTH, scale, band_y)
+            
+            self.damage.flush(x, ILI9488.HEIGHT, band_y)
     
-        
-        # Calculate and scale the first y value.
-        y_old = self.current_values[0]
-        y_old = int((y_old / current_max) * self.Y_HEIGHT)
-        
-        
-        # Draw current data into diagram.
-        for i, value in enumerate(self.current_values[:100]):
-            y = int((value / current_max) * self.Y_HEIGHT)
-            self.lcd.line(self.X_OFFSET + i * 2, self.Y_OFFSET - y_old, self.X_OFFSET + (i + 1) * 2, self.Y_OFFSET - y, ILI9488.RED)
-            self.lcd.line(self.X_OFFSET - 1 + i * 2, self.Y_OFFSET - y_old, self.X_OFFSET - 1 + (i + 1) * 2, self.Y_OFFSET - y, ILI9488.RED)
-            y_old = y
+    
+    def draw_graph_strip(self, first, stop, scale):
+        ''' Draws the graph values from first to stop and sends only their columns, the
+            rest of the graph stays on the display.
+            
+            The columns are drawn as a narrow frame buffer in the display buffer, which
+            holds nothing between panes, band by band if it holds fewer rows than the graph.
+        '''
+        # Columns of the new values, including the end of the previous line segment,
+        # rounded up to whole bytes of every row in the indexed formats.
+        x = self.X_OFFSET + 2 * first - 1
+        width = (2 * (stop - first) + 5) & ~0x3
+        height = self.Y_OFFSET + 2
+        lines = self.lcd.lines
+        
+        for band_y in range(0, height, lines):
+            rows = min(lines, height - band_y)
             
+            strip = framebuf.FrameBuffer(self.lcd.buffer, width, rows, self.lcd.format)
+            strip.blit(self.background, -x, -band_y, -1, self.palette)
+            self.draw_trace(strip, x, x + width, scale, band_y)
             
-        self.lcd.update_rectangle(ILI9488.LEFT, ILI9488.BOTTOM)
+            self.damage.send(self.lcd.buffer, 0, 0, width, rows, x, ILI9488.HEIGHT + band_y, width)
     
     
-    def draw_graph_part_2(self):
-        ''' Draws the right part of the graph.
+    def draw_graph_background(self, buffer, color):
+        ''' Draws axes and grid of the whole lower screen half into the frame buffer.
         '''
-        self.lcd.fill(0xFDDE)
+        end = self.X_OFFSET + 2 * self.MAX_VALUE_NUMBER
         
-        length = ILI9488.WIDTH - self.X_OFFSET
-        self.lcd.hline(0, self.Y_OFFSET, length, ILI9488.BLACK)
-        self.lcd.hline(0, self.Y_OFFSET + 1, length, ILI9488.BLACK)
+        # Graph frame.
+        buffer.hline(self.X_OFFSET, self.Y_OFFSET, end - self.X_OFFSET, color)
+        buffer.hline(self.X_OFFSET, self.Y_OFFSET + 1, end - self.X_OFFSET, color)
+        buffer.vline(self.X_OFFSET, self.Y_OFFSET - self.height, self.height, color)
+        buffer.vline(self.X_OFFSET - 1, self.Y_OFFSET - self.height, self.height, color)
+        
+        # Y coordinate lines.
+        buffer.hline(self.X_OFFSET - 6, 1, 12, color)
+        buffer.hline(self.X_OFFSET - 6, 2, 12, color)
+        buffer.hline(self.X_OFFSET - 6, self.Y_OFFSET - int(self.height / 2), 12, color)
+        buffer.hline(self.X_OFFSET - 6, self.Y_OFFSET - int(self.height / 2) - 1, 12, color)
+        
+        # X-coordinate lines.
+        for x in range(self.X_OFFSET + 120, end, 120):
+            buffer.vline(x, self.Y_OFFSET - 5, 12, color)
+            buffer.vline(x + 1, self.Y_OFFSET - 5, 12, color)
         
-            
         # X dotted lines.
-        for x in range(5):
+        step = (end - self.X_OFFSET) // 8
+        for x in range(self.X_OFFSET + step, end + 1, step):
             for y in range(int(self.Y_OFFSET / 4) + 1):
-                self.lcd.vline(int(length / 4) * x, self.Y_OFFSET - y * 4, 2, ILI9488.BLACK)    
-            
+                buffer.vline(x, self.Y_OFFSET - y * 4, 2, color)
         
-        # Y dotted lines.        
+        # Y dotted lines.
         for y in [1, 2, 3]:
-            for x in range(int(length / 4) + 1):
-                self.lcd.vline(x * 4, self.Y_OFFSET - int(self.height / 4) * y, 2, ILI9488.BLACK)
+            for x in range(self.X_OFFSET, end + 1, 4):
+                buffer.vline(x, self.Y_OFFSET - int(self.height / 4) * y, 2, color)
+    
+    
+    def draw_trace(self, buffer, x0, x1, scale, y0=0):
+        ''' Draws the minimum to maximum span and the mean line of the graph values within
+            the columns x0 to x1 into the frame buffer, whose top left corner is column x0
+            and row y0.
+        '''
+        mean = self.graph.mean
+        envelope = self.ink[self.ENVELOPE_COLOR]
+        red = self.ink[ILI9488.RED]
         
-        # Draw time with unit, and x-coordinate lines.
-        self.lcd.vline(40, self.Y_OFFSET - 5, 12, ILI9488.BLACK)
-        self.lcd.vline(41, self.Y_OFFSET - 5, 12, ILI9488.BLACK)
-        string = str(int((self.frames_sec * 120 + self.time_offset) / 60)) + ' min'
-        self.lcd.text(string, 30, ILI9488.HEIGHT - 15, ILI9488.BLACK)
+        # X axis row in the frame buffer.
+        base = self.Y_OFFSET - y0
         
-        self.lcd.vline(160, self.Y_OFFSET - 5, 12, ILI9488.BLACK)
-        self.lcd.vline(161, self.Y_OFFSET - 5, 12, ILI9488.BLACK)
-        string = str(int((self.frames_sec * 180 + self.time_offset) / 60)) + ' min'
-        self.lcd.text(string, 150, ILI9488.HEIGHT - 15, ILI9488.BLACK)
+        # Value i touches the columns X_OFFSET + 2 * i - 1 to X_OFFSET + 2 * i + 2.
+        first = max(0, -((self.X_OFFSET + 2 - x0) // 2))
+        stop = min(len(mean), -((self.X_OFFSET - 1 - x1) // 2))
         
-
-        # Draw second graph lines if more than 100 current measurements where done.
-        if len(self.current_values) > 100:
-            # Get maximum current to scale graph. 
-            current_max = int(max(self.current_values) + 1)
-            
-            # Calculate and scale the first y value.
-            y_old = int((self.current_values[99] / current_max) * self.Y_HEIGHT)
-            
-            
-            # Draw current data into diagram.
-            for i, value in enumerate(self.current_values[100:]):
-                y = int((value / current_max) * self.Y_HEIGHT)
-                self.lcd.line(i * 2, self.Y_OFFSET - y_old, (i + 1) * 2, self.Y_OFFSET - y, ILI9488.RED)
-                self.lcd.line(i * 2, self.Y_OFFSET - y_old, 1 + (i + 1) * 2, self.Y_OFFSET - y, ILI9488.RED)
-                y_old = y
-            
-            
-            
-        self.lcd.update_rectangle(ILI9488.RIGHT, ILI9488.BOTTOM)
-
+        if first >= stop:
+            return
+        
+        # Draw the span of each value first, so the line stays on top.
+        x = self.X_OFFSET + 2 * first + 1 - x0
+        for lows, highs in zip(self.graph.minimum.windows(first, stop), self.graph.maximum.windows(first, stop)):
+            for low, high in zip(lows, highs):
+                y_min = low * self.Y_HEIGHT // scale
+                y_max = high * self.Y_HEIGHT // scale
+                buffer.vline(x, base - y_max, y_max - y_min + 1, envelope)
+                buffer.vline(x + 1, base - y_max, y_max - y_min + 1, envelope)
+                x += 2
         
+        # Calculate and scale the first y value.
+        y_old = mean[first - 1 if first else 0] * self.Y_HEIGHT // scale
+        
+        # Draw current data into diagram.
+        x = self.X_OFFSET + 2 * first - x0
+        for window in mean.windows(first, stop):
+            for value in window:
+                y = value * self.Y_HEIGHT // scale
+                buffer.line(x, base - y_old, x + 2, base - y, red)
+                buffer.line(x - 1, base - y_old, x + 1, base - y, red)
+                y_old = y
+                x += 2
+    
+    
     def draw_numeric_values(self):
-        ''' Draws the numerical data.
+        ''' Draws the numerical data, only the rows whose text changed.
         '''
-        self.lcd.fill(ILI9488.BLACK)
-        
         # X position offsets of the different string parts.
         x_character = 65
         x_equals = 80
         x_value = 180
         x_unit = 185
         
-        y_pos = 2
+        # Row height in pixel.
+        height = 26
+        
+        self.use_colors(self.NUMERIC_COLORS)
+        ink = self.ink
+        white = ink[ILI9488.WHITE]
         
-        # Current.
-        self.draw_string_right_adjusted('I', x_character, y_pos, ILI9488.WHITE)
-        self.draw_string('=', x_equals, y_pos, ILI9488.WHITE)
+        full = self.damage.changed('numeric', True, 0, 0, ILI9488.WIDTH, ILI9488.HEIGHT)
         
         if self.process_active:
-            string = str('%1.1f' %self.current_values[-1]) if self.current_values[-1] < 1000 else '%1.1f' %(self.current_values[-1] / 1000)
-            self.draw_string('mA' if self.current_values[-1] < 1000 else 'A', x_unit, y_pos, ILI9488.WHITE)
+            current = self.scale_value(self.current, 'A')
         else:
-            string = '0'
-            self.draw_string('mA', x_unit, y_pos, ILI9488.WHITE)
-        
-        self.draw_string_right_adjusted(string, x_value, y_pos, ILI9488.WHITE)
-        
-        
-        y_pos += 30
-        
-        # Maximum current.
-        self.draw_string_right_adjusted('Imax', x_character, y_pos, ILI9488.WHITE)
-        self.draw_string('=', x_equals, y_pos, ILI9488.WHITE)
-        
-        string = '%1.1f' %self.current_max if self.current_max < 1000 else '%1.1f' %(self.current_max / 1000)
-        self.draw_string('mA' if self.current_max < 1000 else 'A', x_unit, y_pos, ILI9488.WHITE)
-        self.draw_string_right_adjusted(string, x_value, y_pos, ILI9488.WHITE)
-        
-        
-        y_pos += 30
-        
-        # Voltage.
-        self.draw_string_right_adjusted('U', x_character, y_pos, ILI9488.WHITE)
-        self.draw_string('=', x_equals, y_pos, ILI9488.WHITE)
-        string = '%1.1f' %self.voltage
-        self.draw_string_right_adjusted(string, x_value, y_pos, ILI9488.WHITE)
-        self.draw_string('V', x_unit, y_pos, ILI9488.WHITE)
-        
-        y_pos += 30
-        
-        # Power
-        self.draw_string_right_adjusted('P', x_character, y_pos, ILI9488.WHITE)
-        self.draw_string('=', x_equals, y_pos, ILI9488.WHITE)
-        string = '%1.1f' %self.power if self.power < 1000 else '%1.1f' %(self.power / 1000)
-        self.draw_string_right_adjusted(string, x_value, y_pos, ILI9488.WHITE)
-        self.draw_string('mW' if self.power < 1000 else 'W', x_unit, y_pos, ILI9488.WHITE)
-        
-        y_pos += 30
-        
-        # Work.
-        self.draw_string_right_adjusted('W', x_character, y_pos, ILI9488.WHITE)
-        self.draw_string('=', x_equals, y_pos, ILI9488.WHITE)
-        string = '%1.2f' %(self.work / 3600)
-        self.draw_string_right_adjusted(string, x_value, y_pos, ILI9488.WHITE)
-        self.draw_string('Wh', x_unit, y_pos, ILI9488.WHITE)
+            current = '0', 'mA'
+        
+        # Name, value and unit of current, maximum current, voltage, power, work and charge.
+        rows = (
+            ('I', current),
+            ('Imax', self.scale_value(self.current_stats.max, 'A')),
+            ('U', ('%1.1f' %(self.voltage / 1000000), 'V')),
+            ('P', self.scale_value(self.power, 'W')),
+            ('W', self.scale_value(self.work.micro() // 3600, 'Wh', '%1.2f')),
+            ('Q', self.scale_value(self.charge.micro() // 3600, 'Ah', '%1.2f')),
+        )
+        
+        # Rows that changed.
+        changed = []
+        y_pos = 2
+        for name, (string, unit) in rows:
+            if self.damage.changed(name, (string, unit), 0, y_pos, ILI9488.WIDTH, height):
+                changed.append((y_pos, name, string, unit))
+            
+            y_pos += height
         
-
-        self.lcd.update_rectangle(ILI9488.LEFT, ILI9488.TOP)
-
-
-
-
+        for band_y in self.bands():
+            if full:
+                self.lcd.fill(ink[ILI9488.BLACK])
+            
+            for y_pos, name, string, unit in changed:
+                if not self.in_band(y_pos, height):
+                    continue
+                
+                y = y_pos - band_y
+                self.lcd.fill_rect(0, y, ILI9488.WIDTH, height, ink[ILI9488.BLACK])
+                self.draw_string_right_adjusted(name, x_character, y, white)
+                self.draw_string('=', x_equals, y, white)
+                self.draw_string_right_adjusted(string, x_value, y, white)
+                self.draw_string(unit, x_unit, y, white)
+            
+            self.damage.flush(0, 0, band_y)
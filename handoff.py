@@ -0,0 +1,195 @@
+from integrator import EnergyIntegrator
+from stats import Statistics, Sums
+import array
+
+
+
+class FrameData:
+    ''' Aggregate record of the samples collected between two GUI frames, in integer
+        uA, uW and uV: sample count, minimum, maximum and mean of every quantity,
+        and the energy and charge delta of the frame.
+        
+        Samples are only added to integer sums, their statistics are computed once
+        by finish() when the frame is taken.
+    '''
+    def __init__(self, mode=EnergyIntegrator.TRAPEZOID):
+        # Energy in uJ and charge in uC of the frame.
+        self.integrator = EnergyIntegrator(mode)
+        self.energy = self.integrator.energy
+        self.charge = self.integrator.charge
+        
+        self.current_sums = Sums()
+        self.power_sums = Sums()
+        self.voltage_sums = Sums()
+        
+        self.current_stats = Statistics()
+        self.power_stats = Statistics()
+        self.voltage_stats = Statistics()
+        self.reset()
+    
+    
+    def reset(self):
+        self.count = 0
+        self.voltage = 0
+        self.integrator.reset()
+        self.current_sums.reset()
+        self.power_sums.reset()
+        self.voltage_sums.reset()
+        self.current_stats.reset()
+        self.power_stats.reset()
+        self.voltage_stats.reset()
+    
+    
+    def add(self, timestamp, current, power, voltage):
+        ''' Adds one sample and integrates power and current since the previous one.
+        '''
+        self.integrator.add(timestamp, current, power)
+        self.current_sums.add(current)
+        self.power_sums.add(power)
+        self.voltage_sums.add(voltage)
+        self.count += 1
+        self.voltage = voltage
+    
+    
+    def finish(self):
+        ''' Computes the statistics of all samples added.
+        '''
+        self.current_stats.set_sums(self.current_sums)
+        self.power_stats.set_sums(self.power_sums)
+        self.voltage_stats.set_sums(self.voltage_sums)
+    
+    
+    def mean_current(self):
+        return int(self.current_stats.mean)
+    
+    
+    def mean_power(self):
+        return int(self.power_stats.mean)
+
+
+
+class Handoff:
+    ''' Double buffered exchange of frame data between two threads or cores.
+    
+        The producer always adds to the active buffer, the consumer swaps the buffers
+        and owns the filled one until its next swap. The lock is only held for a
+        single add or for the swap itself.
+    '''
+    def __init__(self, lock, mode=EnergyIntegrator.TRAPEZOID):
+        self.lock = lock
+        self.buffers = (FrameData(mode), FrameData(mode))
+        self.active = 0
+    
+    
+    def add(self, timestamp, current, power, voltage):
+        ''' Adds a sample, called by the producer.
+        '''
+        self.lock.acquire()
+        self.buffers[self.active].add(timestamp, current, power, voltage)
+        self.lock.release()
+    
+    
+    def take(self):
+        ''' Returns the data collected since the last call, called by the consumer.
+        '''
+        self.lock.acquire()
+        filled = self.buffers[self.active]
+        self.active ^= 1
+        
+        # Continue the energy integration in the other buffer.
+        active = self.buffers[self.active]
+        active.reset()
+        active.integrator.continue_from(filled.integrator)
+        self.lock.release()
+        
+        # The producer no longer writes to the filled buffer.
+        filled.finish()
+        
+        return filled
+
+
+
+class SampleRing:
+    ''' Preallocated ring buffer of samples between one producer and one consumer.
+    
+        Every index is written by one side only and a sample is published after it is
+        completely written, so no locking is needed, neither against a scheduled
+        callback nor against the other core. This is why it does not build on
+        RingBuffer, whose append changes both start and length and overwrites the
+        oldest value, which would let the producer and consumer race on shared state.
+    '''
+    def __init__(self, capacity, mode=EnergyIntegrator.TRAPEZOID):
+        self.capacity = capacity
+        
+        # Ring buffer columns, timestamps in us, the others in uA, uW and uV.
+        self.timestamps = array.array('I', bytes(4 * capacity))
+        self.currents = array.array('i', bytes(4 * capacity))
+        self.powers = array.array('i', bytes(4 * capacity))
+        self.voltages = array.array('i', bytes(4 * capacity))
+        
+        # Write index, only changed by the producer.
+        self.head = 0
+        # Read index, only changed by the consumer.
+        self.tail = 0
+        
+        # Samples dropped because the ring buffer was full.
+        self.overruns = 0
+        
+        # Frame data filled by take().
+        self.frame = FrameData(mode)
+        self._frame_add_ref = self.frame.add
+    
+    
+    def add(self, timestamp, current, power, voltage):
+        ''' Pushes a sample, called by the producer.
+        '''
+        head = self.head
+        next_head = (head + 1) % self.capacity
+        
+        # Drop the newest sample if the consumer is behind.
+        if next_head == self.tail:
+            self.overruns += 1
+            return
+        
+        self.timestamps[head] = timestamp
+        self.currents[head] = current
+        self.powers[head] = power
+        self.voltages[head] = voltage
+        
+        # Publish the sample after it is completely written.
+        self.head = next_head
+    
+    
+    def available(self):
+        ''' Returns the number of samples waiting in the ring buffer.
+        '''
+        return (self.head - self.tail) % self.capacity
+    
+    
+    def drain(self, handler):
+        ''' Calls handler(timestamp, current, power, voltage) for every waiting sample
+            and returns the number of drained samples.
+        '''
+        tail = self.tail
+        head = self.head
+        count = 0
+        
+        while tail != head:
+            handler(self.timestamps[tail], self.currents[tail], self.powers[tail], self.voltages[tail])
+            tail = (tail + 1) % self.capacity
+            count += 1
+        
+        # Release the slots to the producer.
+        self.tail = tail
+        
+        return count
+    
+    
+    def take(self):
+        ''' Drains all waiting samples and returns them as frame data, called by the consumer.
+        '''
+        self.frame.reset()
+        self.drain(self._frame_add_ref)
+        self.frame.finish()
+        
+        return self.frame
@@ -0,0 +1,163 @@
+from ringbuffer import RingBuffer
+from stats import WindowMax
+from decimate import Envelope
+
+
+
+class Tier:
+    ''' History of one resolution, with minimum, maximum and mean current in uA per bucket.
+    '''
+    def __init__(self, period, capacity, ratio):
+        # Bucket length in s and number of finer buckets per bucket.
+        self.period = period
+        self.ratio = ratio
+        
+        self.minimum = RingBuffer(capacity)
+        self.maximum = RingBuffer(capacity)
+        self.mean = RingBuffer(capacity)
+        
+        # Maximum of the stored buckets, to scale the graph.
+        self.window = WindowMax(capacity)
+        self.reset()
+    
+    
+    def reset(self):
+        self.minimum.clear()
+        self.maximum.clear()
+        self.mean.clear()
+        self.window.reset()
+        
+        # Number of buckets closed since the session start.
+        self.buckets = 0
+        self.reset_pending()
+    
+    
+    def reset_pending(self):
+        ''' Clears the bucket being filled.
+        '''
+        self.parts = 0
+        self.low = 0
+        self.high = 0
+        self.sum = 0
+    
+    
+    def add(self, minimum, maximum, mean):
+        ''' Adds a part to the bucket being filled.
+        '''
+        if not self.parts:
+            self.low = minimum
+            self.high = maximum
+        else:
+            self.low = minimum if minimum < self.low else self.low
+            self.high = maximum if maximum > self.high else self.high
+        
+        self.sum += mean
+        self.parts += 1
+    
+    
+    def close(self):
+        ''' Stores the bucket being filled and starts a new one.
+        '''
+        self.minimum.append(self.low)
+        self.maximum.append(self.high)
+        self.mean.append(self.sum // self.parts)
+        self.window.add(self.high)
+        self.buckets += 1
+        self.reset_pending()
+    
+    
+    def peak(self):
+        ''' Returns the largest maximum of the stored buckets.
+        '''
+        return self.window.max()
+    
+    
+    def start_time(self):
+        ''' Returns the session time in s of the oldest stored bucket.
+        '''
+        return (self.buckets - len(self.mean)) * self.period
+
+
+
+class History:
+    ''' Current history at several resolutions, each a fixed size tier.
+    
+        The finest tier collects the frames of each second, every coarser tier is fed
+        with the closed buckets of the one below. Memory stays constant however long
+        a session runs, and every tier holds the same number of buckets to draw.
+        Sessions longer than the coarsest tier are shown by an envelope of the whole session.
+    '''
+    # Bucket lengths of the tiers in s.
+    PERIODS = (1, 10, 60, 600, 3600)
+    
+    
+    def __init__(self, capacity, periods=PERIODS):
+        self.tiers = [Tier(period, capacity, period // periods[i - 1] if i else 0) for i, period in enumerate(periods)]
+        self.overview = Envelope(capacity, periods[0])
+        self.capacity = capacity
+        self.reset()
+    
+    
+    def reset(self):
+        for tier in self.tiers:
+            tier.reset()
+        
+        self.overview.reset()
+        
+        # Session time in ms at which the current bucket of the finest tier ends.
+        self.bucket_end = self.tiers[0].period * 1000
+    
+    
+    def add(self, elapsed_ms, minimum, maximum, mean):
+        ''' Adds the minimum, maximum and mean current of a frame ending at the given session time.
+        
+            The frame belongs to the open bucket. Frames are longer than a bucket when
+            drawing delays them, so every further bucket that ended within the frame is
+            closed too, filled with this frame, which covers their time. Session time
+            stays the number of buckets times the period.
+        '''
+        finest = self.tiers[0]
+        finest.add(minimum, maximum, mean)
+        
+        if elapsed_ms >= self.bucket_end:
+            period_ms = finest.period * 1000
+            
+            for i in range((elapsed_ms - self.bucket_end) // period_ms + 1):
+                if not finest.parts:
+                    finest.add(minimum, maximum, mean)
+                
+                self._close(0)
+            
+            self.bucket_end = (elapsed_ms // period_ms + 1) * period_ms
+    
+    
+    def _close(self, level):
+        ''' Closes the bucket of a tier and feeds it to the next coarser one.
+        '''
+        tier = self.tiers[level]
+        tier.close()
+        
+        if not level:
+            self.overview.add(tier.minimum[-1], tier.maximum[-1], tier.mean[-1])
+        
+        if level + 1 == len(self.tiers):
+            return
+        
+        upper = self.tiers[level + 1]
+        upper.add(tier.minimum[-1], tier.maximum[-1], tier.mean[-1])
+        
+        if upper.parts >= upper.ratio:
+            self._close(level + 1)
+    
+    
+    def select(self, width=None):
+        ''' Returns the finest tier that shows the whole session within the width,
+            or the session envelope if the session is longer than all tiers.
+        '''
+        width = width if width else self.capacity
+        
+        for tier in self.tiers:
+            if tier.buckets <= width:
+                return tier
+        
+        return self.overview
@@ -0,0 +1,380 @@
+''' Host side benchmarks of the acquisition and display code.
+
+    Run from the repository root:
+    
+        PYTHONPATH=host python3 host/bench.py sampler [rate] [seconds] [channels]
+        PYTHONPATH=host python3 host/bench.py core [rate] [seconds] [channels]
+        PYTHONPATH=host python3 host/bench.py handoff [seconds]
+        PYTHONPATH=host python3 host/bench.py accuracy
+        PYTHONPATH=host python3 host/bench.py font
+        PYTHONPATH=host python3 host/bench.py display
+        PYTHONPATH=host python3 host/bench.py gui [frames] [display lines] [bits per pixel]
+        PYTHONPATH=host python3 host/bench.py history [hours] [frame ms]
+    
+    Checks print FAILED and exit with status 1 when a result is out of bounds.
+    
+    CPython's own _thread module has the same interface as the MicroPython one and
+    serves as threading backend for the second core.
+'''
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import machine
+
+
+
+def make_bus(channels=1):
+    ''' Returns a bus with the given number of simulated INA219, each always having a new conversion.
+    '''
+    from bus import INA219Bus
+    from ina219 import INA219
+    
+    i2c = machine.I2C(1, devices=range(INA219.I2C_ADDRESS, INA219.I2C_ADDRESS + channels))
+    # Roughly the duration of one register read at 400 kHz.
+    i2c.transaction_us = 110
+    
+    for address in i2c.registers:
+        i2c.set_register(address, INA219.CURRENT_REG, 1234)
+        # Bus voltage with the conversion ready flag always set.
+        i2c.set_register(address, INA219.BUS_VOLTAGE_REG, 0x2000 | INA219.CONVERSION_READY)
+    
+    return INA219Bus(i2c=i2c)
+
+
+def print_channels(bus, taken, seconds):
+    throughput = bus.throughput()
+    
+    for i, channel in enumerate(bus.channels):
+        print('  channel 0x%02x: %d samples, %d taken, %d overruns, %d stale, %d errors, %.0f samples/s'
+              % (channel.address, channel.samples, taken[i], getattr(channel.buffer, 'overruns', 0),
+                 channel.stale, channel.errors, throughput[i]))
+
+
+def check(condition, message):
+    ''' Prints the message and exits with status 1 if the condition does not hold.
+    '''
+    if not condition:
+        print('FAILED: ' + message)
+        sys.exit(1)
+
+
+def bench_sampler(rate=940, seconds=2, channels=1):
+    ''' Runs the timer driven sampler and drains it like the GUI does once per frame.
+    '''
+    from sampler import Sampler
+    
+    bus = make_bus(channels)
+    sampler = Sampler(bus, rate)
+    taken = [0] * channels
+    sampler.start()
+    
+    end = time.ticks_add(time.ticks_ms(), int(seconds * 1000))
+    while time.ticks_diff(end, time.ticks_ms()) > 0:
+        time.sleep_ms(100)
+        for i in range(channels):
+            taken[i] += sampler.take(i).count
+    
+    sampler.stop()
+    for i in range(channels):
+        taken[i] += sampler.take(i).count
+    
+    print('rate %d Hz: %d missed timer ticks' % (sampler.rate, sampler.missed))
+    print_channels(bus, taken, seconds)
+
+
+def bench_core(rate=940, seconds=2, channels=1):
+    ''' Runs the second core sampler while the main thread simulates slow frames.
+    '''
+    from sampler import CoreSampler
+    
+    bus = make_bus(channels)
+    sampler = CoreSampler(bus, rate)
+    taken = [0] * channels
+    sampler.start()
+    
+    end = time.ticks_add(time.ticks_ms(), int(seconds * 1000))
+    while time.ticks_diff(end, time.ticks_ms()) > 0:
+        # Rendering stall, sleeping releases the GIL like a second core would run in parallel.
+        time.sleep_ms(200)
+        for i in range(channels):
+            taken[i] += sampler.take(i).count
+    
+    sampler.stop()
+    for i in range(channels):
+        taken[i] += sampler.take(i).count
+    
+    print('rate %d Hz: %d missed periods' % (sampler.rate, sampler.missed))
+    print_channels(bus, taken, seconds)
+
+
+def bench_handoff(seconds=2):
+    ''' Stress test of the double buffered hand-off, checks that no sample or energy gets lost.
+    '''
+    import _thread
+    from handoff import Handoff
+    from integrator import Accumulator
+    
+    handoff = Handoff(_thread.allocate_lock())
+    done = _thread.allocate_lock()
+    state = {'running': True, 'added': 0}
+    
+    def produce():
+        done.acquire()
+        timestamp = 0
+        while state['running']:
+            # 1 W for 10 us each.
+            timestamp += 10
+            handoff.add(timestamp, 1, 1000000, 1)
+            state['added'] += 1
+        done.release()
+    
+    _thread.start_new_thread(produce, ())
+    taken = 0
+    swaps = 0
+    energy = Accumulator()
+    
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        frame = handoff.take()
+        taken += frame.count
+        energy.add(frame.energy)
+        swaps += 1
+    
+    state['running'] = False
+    time.sleep(0.01)
+    done.acquire()
+    frame = handoff.take()
+    taken += frame.count
+    energy.add(frame.energy)
+    
+    expected = (state['added'] - 1) * 10
+    print('%d added, %d taken, %d swaps, energy %d of %d uJ'
+          % (state['added'], taken, swaps, energy.micro(), expected))
+    check(taken == state['added'], 'lost %d samples' % (state['added'] - taken))
+    check(energy.micro() == expected, 'lost %d uJ of energy' % (expected - energy.micro()))
+
+
+# Largest relative error of the integrated energy, well above the rounding to whole uJ.
+ENERGY_ERROR = 1e-6
+
+
+def bench_accuracy():
+    ''' Compares the integer conversions and energy integration with floating point results
+        and checks their error bounds.
+    '''
+    import random
+    from calibration import Calibration
+    from handoff import FrameData
+    from ina219 import INA219
+    from integrator import EnergyIntegrator
+    
+    for shunt_mohm, max_current_ma in ((100, 3200), (100, 400), (10, 10000), (10000, 30)):
+        calibration = Calibration(shunt_mohm, max_current_ma)
+        current_error = max(abs(calibration.current_ua(raw) - raw * calibration.current_lsb_na / 1000)
+                            for raw in range(0x8000))
+        power_error = max(abs(calibration.power_uw(raw) - raw * calibration.power_lsb_nw / 1000)
+                          for raw in range(0x10000))
+        print('shunt %d mOhm, %d mA: current LSB %d nA, max error %.3f uA, power max error %.3f uW'
+              % (shunt_mohm, max_current_ma, calibration.current_lsb_na, current_error, power_error))
+        check(current_error <= 1, 'current error %.3f uA above 1 uA' % current_error)
+        check(power_error <= 1, 'power error %.3f uW above 1 uW' % power_error)
+    
+    # The baseline driver wrote the calibration register 0x1000, a current LSB of 100 uA
+    # and a power LSB of 2 mW, and converted in floats to mA, mW and V. Its currents up
+    # to 1 mA and above 3200 mA were forced to 0, so only the range between is compared.
+    i2c = machine.I2C(1)
+    ina219 = INA219(calibration=Calibration(100, 3200, current_lsb_na=100000), i2c=i2c)
+    check(i2c.registers[INA219.I2C_ADDRESS][INA219.CALIBRATION_REG] == 0x1000, 'calibration register differs from the baseline')
+    
+    for name, unit, register, raws, read, baseline, tolerance in (
+            ('current', 'uA', INA219.CURRENT_REG, range(11, 32001), ina219.get_current, lambda raw: raw / 10 * 1000, 1),
+            ('power', 'uW', INA219.POWER_REG, range(0x10000), ina219.get_power, lambda raw: raw * 2 * 1000, 1),
+            ('bus voltage', 'uV', INA219.BUS_VOLTAGE_REG, range(0x10000), ina219.get_bus_voltage, lambda raw: (raw >> 3) * 4 / 1000 * 1000000, 0.001)):
+        error = 0
+        for raw in raws:
+            i2c.set_register(INA219.I2C_ADDRESS, register, raw)
+            error = max(error, abs(read() - baseline(raw)))
+        
+        print('%s against the baseline driver: max error %.3f %s' % (name, error, unit))
+        check(error <= tolerance, '%s error %.3f %s above %.3f %s' % (name, error, unit, tolerance, unit))
+    
+    # The trapezoid averages two powers with (a + b) // 2, which rounds down by up to
+    # 0.5 uW per interval. Its energy is therefore biased low, by at most 0.5 uW over the
+    # whole integration time, about 1e-7 of the energy here.
+    for mode, name in ((EnergyIntegrator.HOLD, 'hold'), (EnergyIntegrator.TRAPEZOID, 'trapezoid')):
+        frame = FrameData(mode)
+        energy = 0
+        timestamp = 0
+        previous = 0
+        random.seed(1)
+        for i in range(100000):
+            step = random.randint(500, 5000)
+            power = random.randint(0, 5000000)
+            timestamp = time.ticks_add(timestamp, step)
+            frame.add(timestamp, 0, power, 0)
+            
+            if i:
+                energy += (power if mode == EnergyIntegrator.HOLD else (previous + power) / 2) * step / 1000000
+            previous = power
+        
+        energy_error = abs(frame.energy.micro() - energy) / energy
+        print('%s energy %d uJ, float %.1f uJ, error %.2e' % (name, frame.energy.micro(), energy, energy_error))
+        check(energy_error < ENERGY_ERROR, '%s energy error %.2e above %.0e' % (name, energy_error, ENERGY_ERROR))
+        
+        if mode == EnergyIntegrator.TRAPEZOID:
+            bias = 0.5 * timestamp / 1000000
+            check(-1 < energy - frame.energy.micro() <= bias + 1, 'trapezoid energy off the rounding bias of at most %.1f uJ' % bias)
+
+
+
+def bench_font():
+    ''' Compares import time and memory of the font tables and the compiled font module.
+    '''
+    import gc
+    import importlib
+    import tracemalloc
+    
+    for name in ('font', 'fontdata'):
+        sys.modules.pop(name, None)
+        gc.collect()
+        
+        tracemalloc.start()
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        duration = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        print('%s: import %.2f ms, %d bytes allocated' % (name, duration * 1000, memory))
+        del module
+
+
+
+def bench_display():
+    ''' Counts the SPI transfers and chip select transactions of the display driver.
+    '''
+    from ili9488 import ILI9488
+    
+    lcd = ILI9488()
+    print('init: %d transactions, %d transfers, %d bytes' % (lcd.cs.falls, lcd.spi.transfers, lcd.spi.written))
+    
+    lcd.spi.reset_counters()
+    falls = lcd.cs.falls
+    lcd.update_rectangle(ILI9488.LEFT, ILI9488.TOP)
+    print('quadrant update: %d transactions, %d transfers, %d bytes'
+          % (lcd.cs.falls - falls, lcd.spi.transfers, lcd.spi.written))
+
+
+
+def bench_gui(frames=20, lines=160, bits=16):
+    ''' Runs GUI frames with a slowly changing load and reports bytes sent and time per frame,
+        with an RGB565 or palette indexed display buffer of 4 or 2 bits per pixel, and the
+        text cache counters to size its budget.
+    '''
+    import random
+    from gui import GUI
+    from handoff import FrameData
+    from ili9488 import ILI9488
+    
+    format = [format for format, value in ILI9488.BITS.items() if value == bits][0]
+    gui = GUI(lines, format)
+    gui.process_active = True
+    gui.tick = time.ticks_ms()
+    random.seed(1)
+    
+    sent = 0
+    flush_us = 0
+    start = time.perf_counter()
+    
+    for i in range(frames):
+        frame = FrameData()
+        for j in range(200):
+            frame.add(j * 5000, random.randint(10000, 12000), random.randint(50000, 60000), 5000000)
+        frame.finish()
+        
+        gui.add_frame(frame)
+        gui.update()
+        sent += gui.damage.bytes
+        flush_us += gui.damage.flush_us
+    
+    duration = time.perf_counter() - start
+    print('%d frames, %d byte display buffer: %d bytes sent, %.1f ms sending, %.1f ms total per frame'
+          % (frames, len(gui.lcd.buffer), sent // frames, flush_us / frames / 1000, duration / frames * 1000))
+    
+    cache = gui.text_cache
+    print('text cache: %d hits, %d misses, %d evictions, %d of %d bytes used'
+          % (cache.hits, cache.misses, cache.evictions, cache.used, cache.budget))
+
+
+
+def bench_history(hours=210, frame_ms=1100):
+    ''' Feeds a session of the given length into the history with frames longer than a
+        bucket, and checks the time of every tier and the envelope beyond the coarsest tier.
+    '''
+    from history import History
+    
+    # Every frame goes into the bucket it ends in or at the end of, a late frame also
+    # into the buckets it skipped, and nothing into the bucket after it.
+    for frames, expected in (((1000, 2000, 3000, 4000), [10, 20, 30, 40]),
+                             ((1000, 2000, 4600), [10, 20, 46, 46]),
+                             ((1100, 2200, 3300), [11, 22, 33])):
+        history = History(200)
+        for elapsed in frames:
+            history.add(elapsed, 0, 100, elapsed // 100)
+        
+        finest = history.tiers[0]
+        buckets = [finest.mean[i] for i in range(len(finest.mean))]
+        check(buckets == expected and not finest.parts, 'frames at %s ms give buckets %s, expected %s' % (frames, buckets, expected))
+    
+    history = History(200)
+    # One peak early in the session, which must survive all merges of the envelope.
+    spike = 3000000
+    elapsed = 0
+    selected = set()
+    
+    start = time.perf_counter()
+    while elapsed < hours * 3600000:
+        elapsed += frame_ms
+        current = spike if elapsed == 1000 * frame_ms else 10000 + elapsed // 1000 % 1000
+        history.add(elapsed, current - 5000, current + 5000, current)
+        
+        if not elapsed % 3600000:
+            selected.add(history.select().period)
+    duration = time.perf_counter() - start
+    
+    for tier in history.tiers:
+        end = tier.start_time() + len(tier.mean) * tier.period
+        print('tier %d s: %d buckets, %d to %d s' % (tier.period, tier.buckets, tier.start_time(), end))
+        check(0 <= elapsed // 1000 - end < tier.period, 'tier %d s ends at %d s, session at %d s' % (tier.period, end, elapsed // 1000))
+    
+    overview = history.overview
+    covered = len(overview.mean) * overview.period + overview.parts * overview.base_period
+    print('envelope: %d columns of %d s, %d s covered, peak %d uA, selected after %d h: %s'
+          % (len(overview.mean), overview.period, covered, overview.peak(), hours, history.select() is overview))
+    print('%.1f us per frame, tiers selected %s' % (duration / (elapsed // frame_ms) * 1000000, sorted(selected)))
+    
+    check(covered == elapsed // 1000, 'envelope covers %d s of %d s' % (covered, elapsed // 1000))
+    check(overview.peak() == spike + 5000 and max(overview.maximum[i] for i in range(len(overview.maximum))) == spike + 5000, 'envelope lost the peak')
+    if hours * 3600 > 200 * history.tiers[-1].period:
+        check(history.select() is overview, 'envelope not selected after %d h' % hours)
+
+
+
+BENCHMARKS = {
+    'sampler': bench_sampler,
+    'core': bench_core,
+    'handoff': bench_handoff,
+    'accuracy': bench_accuracy,
+    'font': bench_font,
+    'display': bench_display,
+    'gui': bench_gui,
+    'history': bench_history,
+}
+
+
+if __name__ == '__main__':
+    name = sys.argv[1] if len(sys.argv) > 1 else 'sampler'
+    BENCHMARKS[name](*[int(arg) for arg in sys.argv[2:]])
@@ -0,0 +1,106 @@
+''' Font compiler, converts the glyph tables of font.py into a module of bytes literals.
+    
+    Run from the repository root:
+        
+        python3 host/fontc.py [source module] [output file]
+    
+    The source module defaults to font and the output to fontdata.py. Bytes literals
+    stay in flash when the module is frozen, and the metrics table holds everything
+    the renderer needs per glyph, so nothing is computed from the font at runtime.
+'''
+import importlib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+
+# Characters in the order of the glyph tables.
+CHARACTERS = '.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz='
+
+# Pixels between two glyphs and advance of a space.
+LETTER_SPACING = 4
+SPACE_ADVANCE = 5
+
+# Bytes per glyph in the metrics table.
+METRIC_SIZE = 6
+
+
+def compile_glyph(font, index):
+    ''' Returns the bitmap bytes and the width, height, y offset and advance of a glyph.
+    '''
+    pixel_width = font.FONT_META[index][0]
+    width = (pixel_width + 7) // 8
+    offset = font.FONT_META[index][1]
+    height = (font.FONT_META[index + 1][1] - offset) // width
+    data = bytes(font.FONT_DATA[offset:offset + width * height])
+    
+    # Rightmost set pixel of the last byte column is the drawn width.
+    bit_width = 0
+    for i in range(width - 1, len(data), width):
+        for j in range(8):
+            if (data[i] >> j) & 0x1 and 7 - j > bit_width:
+                bit_width = 7 - j
+    
+    y_offset = font.MAX_FONT_HEIGHT - height if font.MAX_FONT_HEIGHT > height else 0
+    advance = bit_width + (width - 1) * 8 + LETTER_SPACING
+    
+    return data, (pixel_width, height, y_offset, advance)
+
+
+def literal(data):
+    return "b'" + ''.join('\\x%02x' % value for value in data) + "'"
+
+
+def compile_font(font):
+    ''' Returns the source of the compiled font module.
+    '''
+    count = len(font.FONT_META) - 1
+    assert count == len(CHARACTERS), 'font has %d glyphs, expected %d' % (count, len(CHARACTERS))
+    
+    data_lines = []
+    metric_lines = []
+    offset = 0
+    line_height = 0
+    
+    for index in range(count):
+        data, (width, height, y_offset, advance) = compile_glyph(font, index)
+        metrics = bytes((width, height, y_offset, advance, offset >> 8, offset & 0xFF))
+        
+        data_lines.append('    %s  # %s' % (literal(data), CHARACTERS[index]))
+        metric_lines.append('    %s  # %s' % (literal(metrics), CHARACTERS[index]))
+        offset += len(data)
+        line_height = max(line_height, y_offset + height)
+    
+    return '\n'.join([
+        '# Generated by host/fontc.py from %s.py, do not edit.' % font.__name__,
+        '',
+        '# Characters in the order of the glyphs.',
+        'CHARACTERS = %r' % CHARACTERS,
+        '',
+        '# Pixels between two glyphs, advance of a space and height of a text line.',
+        'LETTER_SPACING = %d' % LETTER_SPACING,
+        'SPACE_ADVANCE = %d' % SPACE_ADVANCE,
+        'LINE_HEIGHT = %d' % line_height,
+        '',
+        '# Per glyph: pixel width, height, y offset to the text line, advance to the next',
+        '# glyph and offset of the MONO_HLSB rows in GLYPH_DATA, high byte first.',
+        'METRIC_SIZE = %d' % METRIC_SIZE,
+        'GLYPH_METRICS = (',
+    ] + metric_lines + [
+        ')',
+        '',
+        'GLYPH_DATA = (',
+    ] + data_lines + [
+        ')',
+        '',
+    ])
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else 'font'
+    output = sys.argv[2] if len(sys.argv) > 2 else 'fontdata.py'
+    
+    with open(output, 'w') as file:
+        file.write(compile_font(importlib.import_module(source)))
@@ -0,0 +1,167 @@
+''' Host side stand-in for the MicroPython framebuf module.
+
+    Pixel layouts match the MicroPython formats, so buffers can be exchanged with
+    the display driver unchanged. Rectangles and blits give the same pixels as on
+    the device, lines may differ in single pixels, and text only marks every
+    character cell with a block instead of the built-in 8x8 font.
+'''
+
+
+
+MONO_VLSB = 0
+RGB565 = 1
+GS4_HMSB = 2
+MONO_HLSB = 3
+MONO_HMSB = 4
+GS2_HMSB = 5
+GS8 = 6
+
+MVLSB = MONO_VLSB
+
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buffer = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = stride if stride else width
+    
+    
+    def _locate(self, x, y):
+        ''' Returns byte index, bit shift and bit mask of a pixel.
+        '''
+        format = self.format
+        
+        if format == RGB565:
+            return (y * self.stride + x) * 2, 0, 0xFFFF
+        if format == GS8:
+            return y * self.stride + x, 0, 0xFF
+        if format == MONO_HLSB:
+            return y * ((self.stride + 7) // 8) + x // 8, 7 - (x & 7), 0x1
+        if format == MONO_HMSB:
+            return y * ((self.stride + 7) // 8) + x // 8, x & 7, 0x1
+        if format == MONO_VLSB:
+            return (y // 8) * self.stride + x, y & 7, 0x1
+        if format == GS2_HMSB:
+            return (y * self.stride + x) >> 2, (x & 0x3) * 2, 0x3
+        
+        return (y * self.stride + x) >> 1, 4 if not x & 0x1 else 0, 0xF
+    
+    
+    def _get(self, x, y):
+        index, shift, mask = self._locate(x, y)
+        
+        if self.format == RGB565:
+            return self.buffer[index] | (self.buffer[index + 1] << 8)
+        
+        return (self.buffer[index] >> shift) & mask
+    
+    
+    def _set(self, x, y, color):
+        index, shift, mask = self._locate(x, y)
+        
+        if self.format == RGB565:
+            self.buffer[index] = color & 0xFF
+            self.buffer[index + 1] = (color >> 8) & 0xFF
+            return
+        
+        self.buffer[index] = (self.buffer[index] & ~(mask << shift)) | ((color & mask) << shift)
+    
+    
+    def pixel(self, x, y, color=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        
+        if color is None:
+            return self._get(x, y)
+        
+        self._set(x, y, color)
+    
+    
+    def fill_rect(self, x, y, width, height, color):
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + width)
+        y1 = min(self.height, y + height)
+        
+        if x0 >= x1 or y0 >= y1:
+            return
+        
+        if self.format == RGB565:
+            row = bytes((color & 0xFF, (color >> 8) & 0xFF)) * (x1 - x0)
+            for line in range(y0, y1):
+                start = (line * self.stride + x0) * 2
+                self.buffer[start:start + len(row)] = row
+            return
+        
+        for line in range(y0, y1):
+            for column in range(x0, x1):
+                self._set(column, line, color)
+    
+    
+    def fill(self, color):
+        self.fill_rect(0, 0, self.width, self.height, color)
+    
+    
+    def hline(self, x, y, width, color):
+        self.fill_rect(x, y, width, 1, color)
+    
+    
+    def vline(self, x, y, height, color):
+        self.fill_rect(x, y, 1, height, color)
+    
+    
+    def rect(self, x, y, width, height, color, fill=False):
+        if fill:
+            self.fill_rect(x, y, width, height, color)
+            return
+        
+        self.fill_rect(x, y, width, 1, color)
+        self.fill_rect(x, y + height - 1, width, 1, color)
+        self.fill_rect(x, y, 1, height, color)
+        self.fill_rect(x + width - 1, y, 1, height, color)
+    
+    
+    def line(self, x0, y0, x1, y1, color):
+        ''' Bresenham line, clipped per pixel as on the device.
+        '''
+        dx = abs(x1 - x0)
+        dy = -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        error = dx + dy
+        
+        while True:
+            self.pixel(x0, y0, color)
+            
+            if x0 == x1 and y0 == y1:
+                break
+            
+            double = 2 * error
+            if double >= dy:
+                error += dy
+                x0 += sx
+            if double <= dx:
+                error += dx
+                y0 += sy
+    
+    
+    def text(self, string, x, y, color=1):
+        for i in range(len(string)):
+            self.fill_rect(x + i * 8 + 1, y + 1, 6, 6, color)
+    
+    
+    def blit(self, source, x, y, key=-1, palette=None):
+        ''' Copies the source, the key is compared after the palette lookup as on the device.
+        '''
+        for line in range(max(0, -y), min(source.height, self.height - y)):
+            for column in range(max(0, -x), min(source.width, self.width - x)):
+                color = source._get(column, line)
+                
+                if palette is not None:
+                    color = palette._get(color, 0)
+                
+                if color != key:
+                    self._set(x + column, y + line, color)
@@ -0,0 +1,231 @@
+''' Host side stand-in for the MicroPython machine module.
+
+    Allows running the acquisition code on CPython, e.g. to measure sampler
+    throughput off-device:
+    
+        PYTHONPATH=host python3 host/bench.py sampler
+    
+    Importing this module also adds the MicroPython ticks functions to the
+    CPython time module, so driver modules can be imported unchanged.
+'''
+import threading
+import time
+
+
+
+def _ticks_add(ticks, delta):
+    return (ticks + delta) & 0x3FFFFFFF
+
+
+def _ticks_diff(new, old):
+    return ((new - old + 0x20000000) & 0x3FFFFFFF) - 0x20000000
+
+
+if not hasattr(time, 'ticks_us'):
+    time.ticks_us = lambda: (time.perf_counter_ns() // 1000) & 0x3FFFFFFF
+    time.ticks_ms = lambda: (time.perf_counter_ns() // 1000000) & 0x3FFFFFFF
+    time.ticks_add = _ticks_add
+    time.ticks_diff = _ticks_diff
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    time.sleep_us = lambda us: time.sleep(us / 1000000)
+
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    
+    
+    def __init__(self, id, mode=IN, value=1):
+        self.id = id
+        self.mode = mode
+        self._value = value
+        
+        # Number of high to low edges, e.g. chip select transactions.
+        self.falls = 0
+    
+    
+    def __call__(self, value=None):
+        if value is None:
+            return self._value
+        
+        self.falls += 1 if self._value and not value else 0
+        self._value = value
+    
+    
+    def value(self, value=None):
+        return self(value)
+    
+    
+    def on(self):
+        self(1)
+    
+    
+    def off(self):
+        self(0)
+
+
+
+class I2C:
+    ''' Fake I2C bus with a register file per device address.
+    '''
+    def __init__(self, id, scl=None, sda=None, freq=400000, devices=(0x40,)):
+        self.id = id
+        self.freq = freq
+        self.registers = {address: {} for address in devices}
+        
+        # Number of bus transactions and optional time in us each one takes.
+        self.transactions = 0
+        self.transaction_us = 0
+    
+    
+    def _transaction(self):
+        self.transactions += 1
+        
+        if self.transaction_us:
+            end = time.perf_counter() + self.transaction_us / 1000000
+            while time.perf_counter() < end:
+                pass
+    
+    
+    def scan(self):
+        self._transaction()
+        return sorted(self.registers)
+    
+    
+    def set_register(self, address, register, value):
+        ''' Sets the 16 bit value a register returns on read.
+        '''
+        self.registers[address][register] = value & 0xFFFF
+    
+    
+    def writeto_mem(self, address, register, buffer):
+        self._transaction()
+        
+        if address not in self.registers:
+            raise OSError(19)
+        
+        self.registers[address][register] = (buffer[0] << 8) | buffer[1]
+    
+    
+    def readfrom_mem_into(self, address, register, buffer):
+        self._transaction()
+        
+        if address not in self.registers:
+            raise OSError(19)
+        
+        value = self.registers[address].get(register, 0)
+        buffer[0] = value >> 8
+        buffer[1] = value & 0xFF
+    
+    
+    def readfrom_mem(self, address, register, length):
+        buffer = bytearray(length)
+        self.readfrom_mem_into(address, register, buffer)
+        return bytes(buffer)
+
+
+
+class SPI:
+    ''' Fake SPI bus counting transfers and bytes, reads return zeros.
+    '''
+    def __init__(self, id, baudrate=1000000, sck=None, mosi=None, miso=None):
+        self.id = id
+        self.baudrate = baudrate
+        self.reset_counters()
+    
+    
+    def reset_counters(self):
+        # Number of write and read calls and bytes transferred.
+        self.transfers = 0
+        self.written = 0
+        self.read_bytes = 0
+    
+    
+    def write(self, buffer):
+        self.transfers += 1
+        self.written += memoryview(buffer).nbytes
+    
+    
+    def read(self, length):
+        self.transfers += 1
+        self.read_bytes += length
+        return bytes(length)
+
+
+
+class PWM:
+    def __init__(self, pin):
+        self.pin = pin
+        self._freq = 0
+        self._duty = 0
+    
+    
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        
+        self._freq = value
+    
+    
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        
+        self._duty = value
+
+
+
+class Timer:
+    ''' Periodic timer running its callback in a background thread.
+    '''
+    ONE_SHOT = 0
+    PERIODIC = 1
+    
+    
+    def __init__(self, id=-1, mode=PERIODIC, freq=None, period=None, callback=None):
+        self._thread = None
+        
+        if callback:
+            self.init(mode=mode, freq=freq, period=period, callback=callback)
+    
+    
+    def init(self, mode=PERIODIC, freq=None, period=None, callback=None):
+        self.deinit()
+        
+        self.interval = 1 / freq if freq else period / 1000
+        self.mode = mode
+        self.callback = callback
+        self.ticks = 0
+        
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    
+    def _run(self):
+        deadline = time.perf_counter()
+        
+        while self._running:
+            deadline += self.interval
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            
+            if not self._running:
+                break
+            
+            self.ticks += 1
+            self.callback(self)
+            
+            if self.mode == self.ONE_SHOT:
+                break
+    
+    
+    def deinit(self):
+        self._running = False
+        
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        
+        self._thread = None
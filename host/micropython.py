@@ -0,0 +1,13 @@
+''' Host side stand-in for the MicroPython micropython module.
+'''
+
+
+
+def const(value):
+    return value
+
+
+def schedule(function, argument):
+    ''' Runs the function right away, the host timer already calls from its own thread.
+    '''
+    function(argument)
@@ -1,4 +1,6 @@
 from machine import Pin,SPI,PWM
+from expand import SPAN, expand_gs2, expand_gs4
+from array import array
 import framebuf
 import time
 
@@ -23,14 +25,47 @@ class ILI9488(framebuf.FrameBuffer):
     TOUCH_CS    = 16
     TOUCH_IRQ   = 17
     
+    # Commands of the display controller.
+    COLUMN_ADDRESS = 0x2A
+    PAGE_ADDRESS = 0x2B
+    MEMORY_WRITE = 0x2C
+    
+    # Command, parameters and delay in ms after it.
+    INIT_SEQUENCE = (
+        (0x21, None, 0),
+        (0xC2, b'\x33', 0),
+        (0xC5, b'\x00\x1e\x80', 0),
+        (0xB1, b'\xb0', 0),
+        (0x36, b'\x28', 0),
+        (0xE0, b'\x00\x13\x18\x04\x0f\x06\x3a\x56\x4d\x03\x0a\x06\x30\x3e\x0f', 0),
+        (0xE1, b'\x00\x13\x18\x01\x11\x06\x38\x34\x4d\x06\x0d\x0b\x31\x37\x0f', 0),
+        (0x3A, b'\x55', 0),
+        (0x11, None, 120),
+        (0x29, None, 0),
+        (0xB6, b'\x00\x62', 0),
+        (0x36, b'\x28', 0),
+    )
+    
     RED   =  0x07E0
     GREEN =  0x001f
     BLUE  =  0xf800
     WHITE =  0xffff
     BLACK =  0x0000
     
+    # Bits per pixel of the supported buffer formats, the gray scale formats hold
+    # palette indices expanded to RGB565 while they are sent.
+    BITS = {
+        framebuf.RGB565: 16,
+        framebuf.GS4_HMSB: 4,
+        framebuf.GS2_HMSB: 2,
+    }
+    EXPANDERS = {
+        framebuf.GS4_HMSB: expand_gs4,
+        framebuf.GS2_HMSB: expand_gs2,
+    }
     
-    def __init__(self):
+    
+    def __init__(self, lines=HEIGHT, format=framebuf.RGB565):
         self.cs = Pin(self.LCD_CS, Pin.OUT)
         self.rst = Pin(self.LCD_RST, Pin.OUT)
         self.dc = Pin(self.LCD_DC, Pin.OUT)
@@ -44,36 +79,39 @@ class ILI9488(framebuf.FrameBuffer):
         self.tp_cs = Pin(self.TOUCH_CS, Pin.OUT)
         self.tp_cs.on()
         
-        self.buffer = bytearray(self.WIDTH * self.HEIGHT * 2)
-        super().__init__(self.buffer, self.WIDTH, self.HEIGHT, framebuf.RGB565)
+        # Preallocated command byte and address parameters.
+        self.command = bytearray(1)
+        self.address = bytearray(4)
+        
+        # Frame buffer of a whole quadrant, or of a band of lines drawn one after another.
+        self.lines = lines
+        self.format = format
+        self.buffer = bytearray(self.WIDTH * lines * self.BITS[format] // 8)
+        super().__init__(self.buffer, self.WIDTH, lines, format)
+        
+        # RGB565 colors of the palette indices and one expanded row of pixels.
+        if format != framebuf.RGB565:
+            self.colors = array('H', bytes(2 << self.BITS[format]))
+            self.row = array('H', bytes(2 * self.WIDTH))
+            self.expand = self.EXPANDERS[format]
         
         self.init_display()
     
 
-    def _write_cmd(self, cmd):
-        ''' Writes command to display controller.
-        '''
-        cmd = cmd if isinstance(cmd, list) else [cmd] 
-
-        for value in cmd:
-            self.cs.on()
-            self.dc.off()
-            self.cs.off()
-            self.spi.write(bytearray([value]))
-            self.cs.on()
-
-
-    def _write_data(self, data):
-        ''' Writes data to display controller.
+    def _command(self, command, data=None):
+        ''' Sends a command and its parameter or pixel data in one chip select transaction.
         '''
-        data = data if isinstance(data, list) else [data] 
-
-        for value in data:
-            self.cs.on()
+        self.command[0] = command
+        
+        self.cs.off()
+        self.dc.off()
+        self.spi.write(self.command)
+        
+        if data:
             self.dc.on()
-            self.cs.off()
-            self.spi.write(bytearray([value]))
-            self.cs.on()
+            self.spi.write(data)
+        
+        self.cs.on()
     
     
     def init_display(self):
@@ -84,62 +122,87 @@ class ILI9488(framebuf.FrameBuffer):
         self.rst.on()
         time.sleep_ms(5)
         
-        self._write_cmd([0x21, 0xC2])
-        self._write_data(0x33)
-        
-        self._write_cmd(0XC5)
-        self._write_data([0x0, 0x1E, 0x80])
-        
-        self._write_cmd(0xB1)
-        self._write_data(0xB0)
-        
-        self._write_cmd(0x36)
-        self._write_data(0x28)
-        
-        self._write_cmd(0XE0)
-        self._write_data([0x0, 0x13, 0x18, 0x04, 0x0F, 0x06, 0x3A, 0x56])
-        self._write_data([0x4D, 0x03, 0x0A, 0x06, 0x30, 0x3E, 0x0F])
-        
-        self._write_cmd(0XE1)
-        self._write_data([0x0, 0x13, 0x18, 0x01, 0x11, 0x06, 0x38, 0x34])
-        self._write_data([0x4D, 0x06, 0x0D, 0x0B, 0x31, 0x37, 0x0F])
-
-        self._write_cmd(0X3A)
-        self._write_data(0x55)
-
-        self._write_cmd(0x11)
-        time.sleep_ms(120)
-        self._write_cmd([0x29, 0xB6])
-        self._write_data([0x00, 0x62])
+        for command, data, delay in self.INIT_SEQUENCE:
+            self._command(command, data)
+            
+            if delay:
+                time.sleep_ms(delay)
+    
+    
+    def _set_address(self, command, start, end):
+        ''' Sets the column or page address range from the preallocated parameter buffer.
+        '''
+        address = self.address
+        address[0] = start >> 8
+        address[1] = start & 0xFF
+        address[2] = end >> 8
+        address[3] = end & 0xFF
         
-        self._write_cmd(0x36)
-        self._write_data(0x28)
+        self._command(command, address)
     
     
     def update_rectangle(self, side, height):
-        """ Updates one of the 4 screen rectangles.
+        """ Updates one of the 4 screen rectangles, needs a buffer of a whole quadrant.
         """
-        self._write_cmd(0x2A)
-        self._write_data(0x00)
-        self._write_data(0x00 if side == self.LEFT else 0xF0)
-        self._write_data(0x00 if side == self.LEFT else 0x1)
-        self._write_data(0xEF if side == self.LEFT else 0xDF)
-        
-        self._write_cmd(0x2B)
-        self._write_data(0x00)
-        self._write_data(0x00 if height == self.TOP else 0xA0)
-        self._write_data(0x00 if height == self.TOP else 0x1)
-        self._write_data(0x9f if height == self.TOP else 0x3F)
+        x = 0 if side == self.LEFT else self.WIDTH
+        y = 0 if height == self.TOP else self.HEIGHT
         
-        self._write_cmd(0x2C)
+        self.blit_region(self.buffer, 0, 0, self.WIDTH, self.HEIGHT, x, y)
+    
+    
+    def set_palette(self, colors):
+        ''' Sets the RGB565 colors the palette indices of an indexed buffer are sent as.
+        '''
+        for i, color in enumerate(colors):
+            self.colors[i] = color
+    
+    
+    def set_window(self, x0, y0, x1, y1):
+        ''' Sets the screen window from x0, y0 to x1, y1 inclusive, filled by the next pixel data.
+        '''
+        self._set_address(self.COLUMN_ADDRESS, x0, x1)
+        self._set_address(self.PAGE_ADDRESS, y0, y1)
+    
+    
+    def blit_region(self, buffer, x, y, width, height, screen_x, screen_y, stride=WIDTH):
+        ''' Sends the rectangle at x, y of a buffer in the display format with stride pixels
+            per row to the screen at screen_x, screen_y. RGB565 is sent straight from
+            memoryview slices of the buffer, palette indices are expanded row by row.
+        '''
+        self.set_window(screen_x, screen_y, screen_x + width - 1, screen_y + height - 1)
         
-        self.cs.on()
-        self.dc.on()
+        self.command[0] = self.MEMORY_WRITE
         self.cs.off()
-        self.spi.write(self.buffer)
-        self.cs.on()
+        self.dc.off()
+        self.spi.write(self.command)
+        self.dc.on()
         
-
+        if self.format != framebuf.RGB565:
+            row = memoryview(self.row)[:width]
+            start = y * stride + x
+            
+            for i in range(height):
+                self.expand(buffer, self.row, self.colors, start * SPAN + width)
+                self.spi.write(row)
+                start += stride
+            
+            self.cs.on()
+            return
+        
+        view = memoryview(buffer)
+        start = (y * stride + x) * 2
+        
+        # Full rows are contiguous, otherwise send row by row within the same transaction.
+        if width == stride:
+            self.spi.write(view[start:start + width * height * 2])
+        else:
+            for row in range(height):
+                self.spi.write(view[start:start + width * 2])
+                start += stride * 2
+        
+        self.cs.on()
+    
+    
     def set_backlight(self, duty):
         ''' Sets backlight brightness.
         '''
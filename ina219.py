@@ -1,4 +1,6 @@
 from machine import Pin, I2C
+from calibration import Calibration
+import time
 
 
 
@@ -11,44 +13,233 @@ class INA219:
     CURRENT_REG = 0x4
     CALIBRATION_REG = 0x5
     
-    # Maximum current in mA.
-    MAX_CURRENT = 3200
+    # Configuration register fields, the PGA gain is given by the calibration.
+    CONFIG_RESET = 0x8000
+    BUS_RANGE_32V = 0x2000
+    MODE_CONTINUOUS = 0x7
     
+    # Bus and shunt ADC settings, resolution or 12 bit with on-chip averaging.
+    ADC_9BIT = 0x0
+    ADC_10BIT = 0x1
+    ADC_11BIT = 0x2
+    ADC_12BIT = 0x3
+    ADC_2_SAMPLES = 0x9
+    ADC_4_SAMPLES = 0xA
+    ADC_8_SAMPLES = 0xB
+    ADC_16_SAMPLES = 0xC
+    ADC_32_SAMPLES = 0xD
+    ADC_64_SAMPLES = 0xE
+    ADC_128_SAMPLES = 0xF
     
-    def __init__(self):
-        self.i2c = I2C(1, scl=Pin(27), sda=Pin(26), freq=400000)
-        self.i2c.scan()
+    # Conversion time in us of each ADC setting.
+    ADC_CONVERSION_US = {
+        ADC_9BIT: 84,
+        ADC_10BIT: 148,
+        ADC_11BIT: 276,
+        ADC_12BIT: 532,
+        ADC_2_SAMPLES: 1060,
+        ADC_4_SAMPLES: 2130,
+        ADC_8_SAMPLES: 4260,
+        ADC_16_SAMPLES: 8510,
+        ADC_32_SAMPLES: 17020,
+        ADC_64_SAMPLES: 34050,
+        ADC_128_SAMPLES: 68100,
+    }
+    
+    # Bus and shunt ADC settings of the named profiles.
+    PROFILES = {
+        'fast': (ADC_9BIT, ADC_9BIT),
+        'balanced': (ADC_12BIT, ADC_12BIT),
+        'precise': (ADC_128_SAMPLES, ADC_128_SAMPLES),
+    }
+    
+    # Status flags of the bus voltage register. Conversion ready is cleared
+    # by reading the power register.
+    CONVERSION_READY = 0x2
+    OVERFLOW = 0x1
+    
+    # Interval in us to poll the conversion ready flag.
+    POLL_INTERVAL_US = 50
+    
+    # Register read order of a sample. The INA219 has no register pointer auto increment,
+    # so every register needs its own transaction. Bus voltage is read first and power last,
+    # because reading the power register clears the conversion ready flag.
+    SAMPLE_REGS = (BUS_VOLTAGE_REG, SHUNT_VOLTAGE_REG, CURRENT_REG, POWER_REG)
+    
+    
+    def __init__(self, profile='balanced', calibration=None, i2c=None, address=I2C_ADDRESS):
+        # Use the shared bus if given.
+        self.i2c = i2c if i2c else I2C(1, scl=Pin(27), sda=Pin(26), freq=400000)
+        self.address = address
+        
+        # Preallocated receive buffer, one 2 byte slot per register.
+        self.buffer = bytearray(2 * len(self.SAMPLE_REGS))
+        self.slots = [memoryview(self.buffer)[i * 2:i * 2 + 2] for i in range(len(self.SAMPLE_REGS))]
+        
+        # Decoded values of the last sample in uV, uW and uA.
+        self.shunt_voltage = 0
+        self.bus_voltage = 0
+        self.power = 0
+        self.current = 0
+        self.overflow = False
         
-        # Set configuration for max current and least reading frequency.
-        self.i2c.writeto_mem(self.I2C_ADDRESS, self.CONFIG_REG, b'\x1F\xFF')
-        self.i2c.writeto_mem(self.I2C_ADDRESS, self.CONFIG_REG, b'\x80\x00')
-        self.i2c.writeto_mem(self.I2C_ADDRESS, self.CALIBRATION_REG, b'\x10\x00')
+        # Defaults to the 0.1 Ohm shunt of the device and 3.2 A.
+        self.calibration = calibration if calibration else Calibration()
+        
+        # Reset, then set configuration and calibration.
+        self.i2c.writeto_mem(self.address, self.CONFIG_REG, b'\x80\x00')
+        self.set_profile(profile)
+        self.i2c.writeto_mem(self.address, self.CALIBRATION_REG, self.calibration.register_bytes())
     
     
-    def get_bus_voltage(self) -> float:
-        ''' Returns the INA219 bus voltage in V.
+    def set_profile(self, profile):
+        ''' Sets the ADC resolution and averaging of a named profile.
         '''
-        voltage = self.i2c.readfrom_mem(self.I2C_ADDRESS, self.BUS_VOLTAGE_REG, 2)
-        voltage = float((int.from_bytes(voltage, 'big') >> 3) * 4 / 1000)
-        return voltage
+        if profile not in self.PROFILES:
+            raise ValueError('unknown INA219 profile: %s' % profile)
         
+        self.set_adc(*self.PROFILES[profile])
+    
+    
+    def set_adc(self, bus_adc, shunt_adc):
+        ''' Writes the bus and shunt ADC settings for continuous conversion
+            and updates the conversion period.
+        '''
+        if bus_adc not in self.ADC_CONVERSION_US or shunt_adc not in self.ADC_CONVERSION_US:
+            raise ValueError('invalid INA219 ADC setting')
         
-    def get_power(self) -> int:
-        ''' Returns the power measured by INA219 in mW.
+        config = self.BUS_RANGE_32V | self.calibration.gain | bus_adc << 7 | shunt_adc << 3 | self.MODE_CONTINUOUS
+        self.i2c.writeto_mem(self.address, self.CONFIG_REG, bytes((config >> 8, config & 0xFF)))
+        
+        # Bus and shunt are converted one after another.
+        self.conversion_period_us = self.ADC_CONVERSION_US[bus_adc] + self.ADC_CONVERSION_US[shunt_adc]
+    
+    
+    def _read_register(self, slot):
+        ''' Reads the register of given sample slot into the receive buffer and returns its raw value.
+        '''
+        self.i2c.readfrom_mem_into(self.address, self.SAMPLE_REGS[slot], self.slots[slot])
+        return (self.buffer[slot * 2] << 8) | self.buffer[slot * 2 + 1]
+    
+    
+    def _decode_bus_voltage(self, raw):
+        # LSB of 4 mV in the upper 13 bits.
+        return (raw >> 3) * 4000
+    
+    
+    def _decode_shunt_voltage(self, raw):
+        # Two's complement value with a LSB of 10 uV.
+        raw = raw - 0x10000 if raw & 0x8000 else raw
+        return raw * 10
+    
+    
+    def _decode_power(self, raw):
+        return self.calibration.power_uw(raw)
+    
+    
+    def _decode_current(self, raw):
+        current = self.calibration.current_ua(raw)
+        
+        # Reverse currents are shown as no load.
+        return 0 if current < 0 else current
+    
+    
+    def _read_sample(self, bus_voltage):
+        ''' Reads the remaining registers of a sample whose bus voltage register was read already,
+            and stores the decoded values in the sample attributes.
+        '''
+        shunt_voltage = self._read_register(1)
+        current = self._read_register(2)
+        power = self._read_register(3)
+        
+        self.shunt_voltage = self._decode_shunt_voltage(shunt_voltage)
+        self.bus_voltage = self._decode_bus_voltage(bus_voltage)
+        self.power = self._decode_power(power)
+        self.current = self._decode_current(current)
+        self.overflow = bool(bus_voltage & self.OVERFLOW)
+    
+    
+    def poll(self):
+        ''' Reads a new conversion into the sample attributes and returns True,
+            or returns False if there is none yet. Allocates no memory.
+        '''
+        bus_voltage = self._read_register(0)
+        
+        if not bus_voltage & self.CONVERSION_READY:
+            return False
+        
+        self._read_sample(bus_voltage)
+        return True
+    
+    
+    def read_sample(self):
+        ''' Reads all measurement registers in one go and returns shunt voltage in uV,
+            bus voltage in uV, power in uW, current in uA and the math overflow flag.
+        '''
+        self._read_sample(self._read_register(0))
+        
+        return self.shunt_voltage, self.bus_voltage, self.power, self.current, self.overflow
+    
+    
+    def poll_new_sample(self):
+        ''' Returns a sample like read_sample if a new conversion has completed since the
+            last sample, otherwise None. Costs a single register read if there is none.
+        '''
+        if not self.poll():
+            return None
+        
+        return self.shunt_voltage, self.bus_voltage, self.power, self.current, self.overflow
+    
+    
+    def wait_for_conversion(self, timeout_us=None):
+        ''' Waits until a new conversion has completed and returns its sample,
+            or None if the timeout expires first. Defaults to two conversion periods.
         '''
-        power = self.i2c.readfrom_mem(self.I2C_ADDRESS, self.POWER_REG, 2)
-        power = int.from_bytes(power, 'big') * 2
-        return power
+        timeout_us = timeout_us if timeout_us is not None else 2 * self.conversion_period_us
+        start = time.ticks_us()
+        
+        while True:
+            sample = self.poll_new_sample()
+            if sample is not None:
+                return sample
+            
+            if time.ticks_diff(time.ticks_us(), start) >= timeout_us:
+                return None
+            
+            time.sleep_us(self.POLL_INTERVAL_US)
+    
+    
+    def conversion_ready(self) -> bool:
+        ''' Returns True if a conversion has completed since the power register was read last.
+        '''
+        return bool(self._read_register(0) & self.CONVERSION_READY)
     
     
-    def get_current(self) -> float:
-        ''' Returns the INA219 current in mA.
+    def math_overflow(self) -> bool:
+        ''' Returns True if the power or current calculation of the last conversion overflowed.
         '''
-        current = self.i2c.readfrom_mem(self.I2C_ADDRESS, self.CURRENT_REG, 2)
-        current = int.from_bytes(current, 'big') / 10
-        current = 0 if current > self.MAX_CURRENT else current
+        return bool(self._read_register(0) & self.OVERFLOW)
+    
+    
+    def get_shunt_voltage(self) -> int:
+        ''' Returns the INA219 shunt voltage in uV.
+        '''
+        return self._decode_shunt_voltage(self._read_register(1))
+    
+    
+    def get_bus_voltage(self) -> int:
+        ''' Returns the INA219 bus voltage in uV.
+        '''
+        return self._decode_bus_voltage(self._read_register(0))
         
-        # Filter noise.
-        current = 0 if current <= 1 else current
         
-        return current
\ No newline at end of file
+    def get_power(self) -> int:
+        ''' Returns the power measured by INA219 in uW.
+        '''
+        return self._decode_power(self._read_register(3))
+    
+    
+    def get_current(self) -> int:
+        ''' Returns the INA219 current in uA.
+        '''
+        return self._decode_current(self._read_register(2))
@@ -0,0 +1,106 @@
+import time
+
+
+
+class Accumulator:
+    ''' Exact sum of micro unit values over time, split into small integers.
+    
+        The sum is kept in whole milli units plus the remaining nano and pico units,
+        so it never overflows MicroPython's small integers in sessions of any realistic
+        length, e.g. 298 Wh in uJ or 298 Ah in uC, and adding allocates no memory.
+    '''
+    def __init__(self):
+        self.reset()
+    
+    
+    def reset(self):
+        self.milli = 0
+        # Below one milli unit, less than 1000000.
+        self.nano = 0
+        # Below one nano unit, less than 1000.
+        self.pico = 0
+    
+    
+    def add_product(self, value, dt):
+        ''' Adds a value in micro units multiplied by a time in us.
+        '''
+        # Split the value, so both products stay small for periods up to several ms.
+        pico = self.pico + value % 1000 * dt
+        nano = self.nano + value // 1000 * dt + pico // 1000
+        
+        self.pico = pico % 1000
+        self.milli += nano // 1000000
+        self.nano = nano % 1000000
+    
+    
+    def add(self, other):
+        ''' Adds another accumulator.
+        '''
+        pico = self.pico + other.pico
+        nano = self.nano + other.nano + pico // 1000
+        
+        self.pico = pico % 1000
+        self.milli += other.milli + nano // 1000000
+        self.nano = nano % 1000000
+    
+    
+    def micro(self):
+        ''' Returns the sum in whole micro units, for display.
+        '''
+        return self.milli * 1000 + self.nano // 1000
+
+
+
+class EnergyIntegrator:
+    ''' Integrates power and current over the real sample timestamps.
+    
+        Energy is summed in uJ and charge in uC. The previous sample is kept over
+        resets, so consecutive frames integrate without gaps.
+    '''
+    # Integration methods.
+    TRAPEZOID = 0
+    HOLD = 1
+    
+    
+    def __init__(self, mode=TRAPEZOID):
+        self.mode = mode
+        self.energy = Accumulator()
+        self.charge = Accumulator()
+        
+        # Previous sample, timestamp in us.
+        self.timestamp = None
+        self.current = 0
+        self.power = 0
+    
+    
+    def reset(self):
+        ''' Clears energy and charge, but keeps the previous sample.
+        '''
+        self.energy.reset()
+        self.charge.reset()
+    
+    
+    def continue_from(self, other):
+        ''' Takes over the previous sample of another integrator.
+        '''
+        self.timestamp = other.timestamp
+        self.current = other.current
+        self.power = other.power
+    
+    
+    def add(self, timestamp, current, power):
+        ''' Integrates the interval between the previous sample and this one.
+        '''
+        if self.timestamp is not None:
+            dt = time.ticks_diff(timestamp, self.timestamp)
+            
+            if self.mode == self.TRAPEZOID:
+                self.energy.add_product((self.power + power) // 2, dt)
+                self.charge.add_product((self.current + current) // 2, dt)
+            else:
+                self.energy.add_product(power, dt)
+                self.charge.add_product(current, dt)
+        
+        self.timestamp = timestamp
+        self.current = current
+        self.power = power
@@ -0,0 +1,71 @@
+from fontdata import CHARACTERS, GLYPH_METRICS, METRIC_SIZE, LETTER_SPACING, SPACE_ADVANCE
+
+
+
+class Layout:
+    ''' Measures and positions strings with one advance table of the compiled font.
+        
+        Measuring and drawing use the same advances, so a measured string ends exactly
+        where its drawn pixels end, and spaces count the same in both.
+    '''
+    # Glyph index of characters without glyph, drawn as space.
+    NO_GLYPH = 0xFF
+    
+    # Character codes covered by the tables.
+    CODES = 128
+    
+    
+    def __init__(self):
+        # Glyph index and advance in pixel by character code.
+        self.indices = bytearray([self.NO_GLYPH] * self.CODES)
+        self.advances = bytearray([SPACE_ADVANCE] * self.CODES)
+        
+        for index, letter in enumerate(CHARACTERS):
+            self.indices[ord(letter)] = index
+            self.advances[ord(letter)] = GLYPH_METRICS[index * METRIC_SIZE + 3]
+    
+    
+    def index(self, letter):
+        ''' Returns the glyph index of a letter, or NO_GLYPH.
+        '''
+        code = ord(letter)
+        
+        return self.indices[code] if code < self.CODES else self.NO_GLYPH
+    
+    
+    def advance(self, string):
+        ''' Returns the distance in pixel from the start of a string to the start of the next one.
+        '''
+        advances = self.advances
+        width = 0
+        
+        for letter in string:
+            code = ord(letter)
+            width += advances[code] if code < self.CODES else SPACE_ADVANCE
+        
+        return width
+    
+    
+    def measure(self, string):
+        ''' Returns the drawn width in pixel of a string, without the spacing after its last letter.
+        '''
+        width = self.advance(string)
+        
+        return width - LETTER_SPACING if width else 0
+    
+    
+    def run(self, string):
+        ''' Returns the glyphs of a string as list of x position and glyph index.
+        '''
+        run = []
+        x = 0
+        
+        for letter in string:
+            index = self.index(letter)
+            
+            if index != self.NO_GLYPH:
+                run.append((x, index))
+            
+            x += self.advances[ord(letter)] if index != self.NO_GLYPH else SPACE_ADVANCE
+        
+        return run
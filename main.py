@@ -1,6 +1,10 @@
 from gui import GUI
-from ina219 import INA219
+from bus import INA219Bus
 from ili9488 import ILI9488
+from calibration import Calibration
+from sampler import Sampler, CoreSampler
+from integrator import EnergyIntegrator
+import framebuf
 import time
 
 
@@ -8,11 +12,46 @@ import time
 # GUI frames per sec. 
 FRAMES_SEC = 1
 
+# INA219 samples per sec, limited to the conversion rate of the profile.
+SAMPLE_RATE = 200
+
+# INA219 ADC profile, 'fast', 'balanced' or 'precise'.
+INA219_PROFILE = 'balanced'
+
+# Shunt resistance in mOhm and maximum expected current in mA.
+SHUNT_MOHM = 100
+MAX_CURRENT_MA = 3200
+
+# Run the acquisition on the second core instead of a timer interrupt.
+DUAL_CORE = True
+
+# Index of the INA219 shown on the display, ordered by I2C address.
+CHANNEL = 0
+
+# Energy and charge integration, EnergyIntegrator.TRAPEZOID or EnergyIntegrator.HOLD.
+INTEGRATION = EnergyIntegrator.TRAPEZOID
+
+# Lines of the display buffer. ILI9488.HEIGHT holds a whole screen quadrant in 75 KB,
+# fewer lines draw each quadrant in bands, e.g. 16 lines need 7.5 KB. The 1 bit graph
+# background adds 9.4 KB, the font 2.3 KB and the text cache up to 4 KB.
+DISPLAY_LINES = 16
+
+# Format of the display buffer, framebuf.RGB565 or the palette indexed framebuf.GS4_HMSB
+# and framebuf.GS2_HMSB, which need a quarter and an eighth of the RAM and are expanded
+# to RGB565 row by row while sent. With 16 line bands GS2_HMSB saves another 6.3 KB,
+# but every pixel sent then passes the expansion, which is only fast with a viper build.
+DISPLAY_FORMAT = framebuf.RGB565
+
 
 
 if __name__=='__main__':
-    gui = GUI(FRAMES_SEC)
-    ina219 = INA219()
+    gui = GUI(DISPLAY_LINES, DISPLAY_FORMAT)
+    bus = INA219Bus(INA219_PROFILE, Calibration(SHUNT_MOHM, MAX_CURRENT_MA))
+    if DUAL_CORE:
+        sampler = CoreSampler(bus, SAMPLE_RATE, mode=INTEGRATION)
+    else:
+        sampler = Sampler(bus, SAMPLE_RATE, mode=INTEGRATION)
+    sampler.start()
     
     
     timestamp = time.ticks_ms()
@@ -32,11 +71,7 @@ if __name__=='__main__':
         timestamp = time.ticks_ms()
         
         
-        # Add current, power, work and bus voltage to digram data.
-        gui.add_current_value(ina219.get_current())
-        power = ina219.get_power()
-        gui.update_power(power)       
-        gui.update_work(power)
-        gui.set_bus_voltage(ina219.get_bus_voltage())
+        # Aggregate of all samples of the displayed channel taken since the last frame.
+        gui.add_frame(sampler.take(CHANNEL))
 
         gui.update()
\ No newline at end of file
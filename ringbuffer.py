@@ -0,0 +1,80 @@
+import array
+
+
+
+class RingBuffer:
+    ''' Fixed capacity history of integers in a preallocated array.
+    
+        Appending is O(1) and overwrites the oldest value when the buffer is full.
+        Values are addressed by logical index, 0 is the oldest and -1 the newest.
+    '''
+    def __init__(self, capacity, typecode='i'):
+        self.capacity = capacity
+        self.data = array.array(typecode, bytes(array.array(typecode).itemsize * capacity))
+        self.view = memoryview(self.data)
+        self.clear()
+    
+    
+    def clear(self):
+        # Physical index of the oldest value and number of values.
+        self.start = 0
+        self.length = 0
+    
+    
+    def __len__(self):
+        return self.length
+    
+    
+    def append(self, value):
+        if self.length < self.capacity:
+            self.data[(self.start + self.length) % self.capacity] = value
+            self.length += 1
+        else:
+            self.data[self.start] = value
+            self.start = (self.start + 1) % self.capacity
+    
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+        
+        if not 0 <= index < self.length:
+            raise IndexError('ring buffer index out of range')
+        
+        return self.data[(self.start + index) % self.capacity]
+    
+    
+    def merge_pairs(self, merge):
+        ''' Replaces every two neighbouring values by merge(older, newer) in place, an odd
+            newest value is kept as is. Only for buffers that never overwrote a value, whose
+            array holds the values in order from index 0.
+        '''
+        if self.start:
+            raise ValueError('ring buffer wrapped, its values are not in array order')
+        
+        data = self.data
+        length = self.length
+        
+        for i in range(length // 2):
+            data[i] = merge(data[2 * i], data[2 * i + 1])
+        
+        if length % 2:
+            data[length // 2] = data[length - 1]
+        
+        self.length = (length + 1) // 2
+    
+    
+    def windows(self, start=0, stop=None):
+        ''' Returns the logical range as one or two memoryview slices of the
+            underlying array, in order and without copying.
+        '''
+        stop = self.length if stop is None or stop > self.length else stop
+        start = start if start < stop else stop
+        
+        first = (self.start + start) % self.capacity
+        count = stop - start
+        
+        if first + count <= self.capacity:
+            return (self.view[first:first + count],)
+        
+        return (self.view[first:], self.view[:first + count - self.capacity])
@@ -0,0 +1,167 @@
+from machine import Timer
+from handoff import Handoff, SampleRing
+from integrator import EnergyIntegrator
+import micropython
+import _thread
+import time
+
+
+
+def limit_rate(bus, rate):
+    ''' Limits the sample rate to the conversion rate of the INA219 profile and the bus speed.
+    '''
+    conversion_rate = 1000000 // bus.conversion_period_us
+    rate = rate if rate < conversion_rate else conversion_rate
+    
+    # Every channel needs its own register reads.
+    max_rate = Sampler.MAX_RATE // len(bus.channels)
+    
+    return rate if rate < max_rate else max_rate
+
+
+
+class Sampler:
+    ''' Samples all INA219 of the bus from a timer interrupt into preallocated ring buffers.
+    
+        The timer callback only schedules the actual I2C reads, which then run as soon
+        as the main loop is between two bytecodes.
+    '''
+    # Default sample rate in Hz.
+    RATE = 200
+    
+    # Upper rate limit in Hz, given by the time of four register reads at 400 kHz.
+    MAX_RATE = 2000
+    
+    # Number of samples each ring buffer can hold.
+    CAPACITY = 512
+    
+    
+    def __init__(self, bus, rate=RATE, capacity=CAPACITY, mode=EnergyIntegrator.TRAPEZOID):
+        self.bus = bus
+        self.rate = limit_rate(bus, rate)
+        
+        for channel in bus.channels:
+            channel.buffer = SampleRing(capacity, mode)
+        
+        # Timer ticks lost because the schedule queue was full.
+        self.missed = 0
+        
+        self.running = False
+        self.timer = None
+        
+        # Bound methods allocate, so create them once for the interrupt path.
+        self._sample_ref = self._sample
+        self._tick_ref = self._tick
+    
+    
+    def start(self):
+        ''' Starts periodic sampling.
+        '''
+        if self.running:
+            return
+        
+        self.running = True
+        self.timer = Timer(mode=Timer.PERIODIC, freq=self.rate, callback=self._tick_ref)
+    
+    
+    def stop(self):
+        ''' Stops periodic sampling.
+        '''
+        if self.timer:
+            self.timer.deinit()
+            self.timer = None
+        
+        self.running = False
+    
+    
+    def _tick(self, timer):
+        ''' Timer interrupt handler, defers the I2C access out of the interrupt.
+        '''
+        try:
+            micropython.schedule(self._sample_ref, 0)
+        except RuntimeError:
+            self.missed += 1
+    
+    
+    def _sample(self, _):
+        self.bus.poll()
+    
+    
+    def take(self, channel=0):
+        ''' Returns the samples of a channel taken since the last call as frame data.
+        '''
+        return self.bus.channels[channel].take()
+
+
+
+class CoreSampler:
+    ''' Samples all INA219 of the bus in a loop on the second core.
+    
+        The acquisition thread owns the bus and hands its samples to the rendering
+        core through double buffered hand-offs, so slow display updates on the
+        first core never cause gaps in the measurement.
+    '''
+    def __init__(self, bus, rate=Sampler.RATE, mode=EnergyIntegrator.TRAPEZOID):
+        self.bus = bus
+        self.rate = limit_rate(bus, rate)
+        
+        for channel in bus.channels:
+            channel.buffer = Handoff(_thread.allocate_lock(), mode)
+        
+        # Sample periods the acquisition loop started late.
+        self.missed = 0
+        
+        self.running = False
+        # Held by the acquisition thread as long as it runs.
+        self.done = _thread.allocate_lock()
+    
+    
+    def start(self):
+        ''' Starts the acquisition thread on the second core.
+        '''
+        if self.running:
+            return
+        
+        self.running = True
+        self.done.acquire()
+        _thread.start_new_thread(self._run, ())
+    
+    
+    def stop(self):
+        ''' Stops the acquisition thread and waits until it has finished.
+        '''
+        if not self.running:
+            return
+        
+        self.running = False
+        self.done.acquire()
+        self.done.release()
+    
+    
+    def _run(self):
+        ''' Acquisition loop, paced by the sample period.
+        '''
+        period = 1000000 // self.rate
+        deadline = time.ticks_us()
+        
+        try:
+            while self.running:
+                self.bus.poll()
+                
+                deadline = time.ticks_add(deadline, period)
+                delay = time.ticks_diff(deadline, time.ticks_us())
+                
+                if delay > 0:
+                    time.sleep_us(delay)
+                else:
+                    # Resynchronize instead of bursting to catch up.
+                    self.missed += 1
+                    deadline = time.ticks_us()
+        finally:
+            self.done.release()
+    
+    
+    def take(self, channel=0):
+        ''' Returns the samples of a channel taken since the last call as frame data.
+        '''
+        return self.bus.channels[channel].take()
@@ -0,0 +1,206 @@
+import array
+import math
+
+
+
+class Statistics:
+    ''' Streaming statistics of a series of values, updated in O(1) per value.
+    
+        Mean and variance use Welford's algorithm, two instances can be merged,
+        e.g. the statistics of one frame into those of the whole session. The
+        statistics of a frame are set once from its integer sums.
+    '''
+    def __init__(self):
+        self.reset()
+    
+    
+    def reset(self):
+        self.count = 0
+        self.min = 0
+        self.max = 0
+        self.mean = 0.0
+        # Sum of squared differences from the mean.
+        self.m2 = 0.0
+    
+    
+    def add(self, value):
+        if not self.count:
+            self.min = value
+            self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+        
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    
+    def set_sums(self, sums):
+        ''' Sets count, minimum, maximum, mean and variance from integer sums.
+        '''
+        count = sums.count
+        self.count = count
+        self.min = sums.min
+        self.max = sums.max
+        
+        if not count:
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        
+        total = sums.total()
+        self.mean = sums.first + total / count
+        self.m2 = (sums.squares() * count - total * total) / count
+    
+    
+    def merge(self, other):
+        ''' Adds the values of another statistics object.
+        '''
+        if not other.count:
+            return
+        
+        if not self.count:
+            self.min = other.min
+            self.max = other.max
+        else:
+            self.min = other.min if other.min < self.min else self.min
+            self.max = other.max if other.max > self.max else self.max
+        
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+    
+    
+    def variance(self):
+        ''' Returns the population variance.
+        '''
+        return self.m2 / self.count if self.count else 0.0
+    
+    
+    def stddev(self):
+        return math.sqrt(self.variance())
+    
+    
+    def rms(self):
+        ''' Returns the root mean square, the mean of squares is variance plus squared mean.
+        '''
+        return math.sqrt(self.variance() + self.mean * self.mean)
+
+
+
+class Sums:
+    ''' Count, minimum, maximum, sum and sum of squares of integer values, split into
+        small integers like Accumulator, so adding a value allocates no memory.
+    
+        Values are summed as deviations from the first one, split at 4096, and the
+        partial products of the squares are carried between three parts. All parts
+        stay small integers for up to 32768 values below 2^27 whose squared deviations
+        sum up to less than 2^54, beyond that they grow into long integers.
+    '''
+    def __init__(self):
+        self.reset()
+    
+    
+    def reset(self):
+        self.count = 0
+        self.min = 0
+        self.max = 0
+        
+        # First value, the others are summed as deviations from it.
+        self.first = 0
+        
+        # Sum of deviations in units of 4096 and below.
+        self.high = 0
+        self.low = 0
+        
+        # Sum of squared deviations in units of 2^24, 4096 and 1, the lower two below 4096.
+        self.square_high = 0
+        self.square_middle = 0
+        self.square_low = 0
+    
+    
+    def add(self, value):
+        if not self.count:
+            self.first = value
+            self.min = value
+            self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+        
+        self.count += 1
+        deviation = value - self.first
+        high = deviation >> 12
+        low = deviation & 0xFFF
+        
+        self.high += high
+        self.low += low
+        
+        square = self.square_low + low * low
+        middle = self.square_middle + 2 * high * low + (square >> 12)
+        
+        self.square_low = square & 0xFFF
+        self.square_middle = middle & 0xFFF
+        self.square_high += high * high + (middle >> 12)
+    
+    
+    def total(self):
+        ''' Returns the sum of deviations from the first value.
+        '''
+        return (self.high << 12) + self.low
+    
+    
+    def squares(self):
+        ''' Returns the sum of squared deviations from the first value.
+        '''
+        return (self.square_high << 24) + (self.square_middle << 12) + self.square_low
+
+
+
+class WindowMax:
+    ''' Maximum of the last values in a sliding window, amortized O(1) per value.
+    
+        Keeps a monotonic deque of candidates in preallocated arrays: every value
+        is removed from the back as soon as a newer, larger one arrives.
+    '''
+    def __init__(self, size):
+        self.size = size
+        self.values = array.array('i', bytes(4 * size))
+        self.indices = array.array('I', bytes(4 * size))
+        self.reset()
+    
+    
+    def reset(self):
+        # Index of the next value, deque front position and length.
+        self.index = 0
+        self.front = 0
+        self.length = 0
+    
+    
+    def add(self, value):
+        size = self.size
+        
+        # Drop the front if it left the window.
+        if self.length and self.index - self.indices[self.front] >= size:
+            self.front = (self.front + 1) % size
+            self.length -= 1
+        
+        # Drop smaller values from the back, they can never be the maximum again.
+        while self.length and self.values[(self.front + self.length - 1) % size] <= value:
+            self.length -= 1
+        
+        back = (self.front + self.length) % size
+        self.values[back] = value
+        self.indices[back] = self.index
+        self.length += 1
+        self.index += 1
+    
+    
+    def max(self):
+        return self.values[self.front] if self.length else 0
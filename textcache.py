@@ -0,0 +1,100 @@
+from collections import OrderedDict
+import framebuf
+
+
+
+class TextCache:
+    ''' Rendered strings of one font as MONO_HLSB bitmaps, evicted least recently used
+        first to stay within a byte budget.
+        
+        A bitmap only holds the set pixels of a string, the color is applied by the
+        glyph palette when it is drawn, so one entry serves the string in every color.
+    '''
+    # Default byte budget of the bitmaps.
+    BUDGET = 4096
+    
+    
+    def __init__(self, glyphs, layout, budget=BUDGET):
+        self.glyphs = glyphs
+        self.layout = layout
+        self.budget = budget
+        
+        # Bitmaps by string, in order of use.
+        self.entries = OrderedDict()
+        # Bitmap bytes in use.
+        self.used = 0
+        
+        self.reset_counters()
+    
+    
+    def reset_counters(self):
+        # Strings drawn from the cache.
+        self.hits = 0
+        # Strings rendered on demand.
+        self.misses = 0
+        # Bitmaps dropped to stay within budget.
+        self.evictions = 0
+    
+    
+    def clear(self):
+        self.entries = OrderedDict()
+        self.used = 0
+    
+    
+    def get(self, string):
+        ''' Returns the bitmap of the string, rendered if not cached.
+        '''
+        bitmap = self.entries.pop(string, None)
+        
+        if bitmap:
+            self.hits += 1
+        else:
+            self.misses += 1
+            bitmap = self._render(string)
+            self._make_room(len(bitmap[0]))
+        
+        # Most recently used entries are at the end.
+        if len(bitmap[0]) <= self.budget:
+            self.entries[string] = bitmap
+        
+        return bitmap
+    
+    
+    def _make_room(self, size):
+        ''' Evicts the least recently used bitmaps until size bytes fit into the budget.
+        '''
+        if size > self.budget:
+            return
+        
+        while self.used + size > self.budget:
+            for string in self.entries:
+                break
+            
+            self.used -= len(self.entries.pop(string)[0])
+            self.evictions += 1
+        
+        self.used += size
+    
+    
+    def _render(self, string):
+        ''' Returns the bitmap data and frame buffer of the string laid out by the layout.
+        '''
+        glyphs = self.glyphs
+        width = self.layout.advance(string)
+        
+        data = bytearray((width + 7) // 8 * glyphs.height)
+        bitmap = framebuf.FrameBuffer(data, width, glyphs.height, framebuf.MONO_HLSB)
+        
+        for x, index in self.layout.run(string):
+            bitmap.blit(glyphs.buffers[index], x, glyphs.y_offsets[index], 0)
+        
+        return data, bitmap
+    
+    
+    def draw(self, buffer, string, x, y, color):
+        ''' Draws the string into the frame buffer from its cached bitmap.
+        '''
+        bitmap = self.get(string)[1]
+        
+        self.glyphs.set_color(color)
+        buffer.blit(bitmap, x, y, color ^ 0x1, self.glyphs.palette)